@@ -24,10 +24,16 @@ app.whenReady().then(() => {
 			createWindow();
 			if (python) return;
 			python = spawn("python", ["backend/detection.py"]);
+			// Pointer records arrive batched and length-prefixed
+			// (4-byte LE length + JSON payload)
+			let pending = Buffer.alloc(0);
 			python.stdout.on('data', (data) => {
-				const lines = data.toString().split('\n');
-				for (let line of lines) {
-					if (!line.trim()) continue;
+				pending = Buffer.concat([pending, data]);
+				while (pending.length >= 4) {
+					const len = pending.readUInt32LE(0);
+					if (pending.length < 4 + len) break;
+					const line = pending.slice(4, 4 + len).toString();
+					pending = pending.slice(4 + len);
 					try {
 						console.log("sending wea wea");
 						mainWindow.webContents.send("update-pointer", line);
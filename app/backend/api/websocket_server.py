@@ -1,11 +1,14 @@
 import asyncio
 import websockets
 import json
+from concurrent.futures import ThreadPoolExecutor
 from typing import Set, Dict, Optional
 import logging
 import sys
 import os
 import socket
+import threading
+import time
 
 # Add parent directory to path for imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -23,7 +26,21 @@ except ImportError:
     HAND_TRACKER_TYPE = "Fallback (Testing)"
 import cv2
 import numpy as np
-import base64
+
+# Cap OpenCV's internal thread pool to half the cores so parallel
+# resize/encode doesn't fight the capture and CV worker threads
+cv2.setNumThreads(max(1, (os.cpu_count() or 2) // 2))
+
+# Prefer orjson for hot-path serialization (3-10x faster than stdlib json on
+# these payloads); fall back to the stdlib encoder when it isn't installed
+try:
+    import orjson
+
+    def dumps(obj) -> str:
+        return orjson.dumps(obj).decode('utf-8')
+except ImportError:
+    def dumps(obj) -> str:
+        return json.dumps(obj)
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -41,10 +58,35 @@ class GameWebSocketServer:
         self.input_mapper = InputMapper()
         self.camera_active = False
         self.processing_task = None
-        self.frame_skip_counter = 0
-        self.frame_skip_rate = 1  # Process every frame for better responsiveness
+        self.processed_frames = 0
+        self.preview_interval = 3  # Broadcast a debug preview every Nth frame
         self.board_dimensions = (640, 480)  # Default fallback dimensions
-        
+        # The CV work (resize, hand detection, preview render + JPEG encode)
+        # is CPU-bound; run it in a worker thread so the event loop only
+        # handles WebSocket fanout. OpenCV and MediaPipe release the GIL in
+        # their C code, so a thread gives the loop the same relief as a
+        # process pool without pickling a frame per iteration
+        self._cv_pool = ThreadPoolExecutor(max_workers=1)
+        self._enc_pool = ThreadPoolExecutor(max_workers=1)
+        # Single-slot frame queue between the camera reader thread and the
+        # processing coroutine; old frames are dropped so the latest wins
+        self._frame_queue = None
+        self._reader_thread = None
+        # Resize decision cached at camera start (the capture resolution is
+        # fixed, so the per-frame width check never changes)
+        self._resize_needed = False
+        self._resize_dims = None
+        self._resize_buf = None
+        # Reused 320x240 thumbnail buffer for debug previews
+        self._preview_buf = np.empty((240, 320, 3), np.uint8)
+        # Last broadcast hand position (pos, is_open, timestamp) used to
+        # suppress redundant hand_position messages
+        self._last_hand_pos = (None, None, 0.0)
+        # Serialized game_state payload, cached against the engine's state
+        # snapshot so repeat connects between moves skip re-serialization
+        self._state_snapshot = None
+        self._state_payload = None
+
         logger.info(f"Using hand tracker: {HAND_TRACKER_TYPE}")
         
     async def register(self, websocket):
@@ -52,16 +94,17 @@ class GameWebSocketServer:
         self.clients.add(websocket)
         logger.info(f"Client connected. Total clients: {len(self.clients)}")
         
-        # Send initial game state
-        await websocket.send(json.dumps({
-            'type': 'game_state',
-            'data': {
-                'board': self.game_engine.board.tolist(),
-                'current_player': int(self.game_engine.current_player),
-                'piece_counts': {k: int(v) for k, v in self.game_engine.get_piece_counts().items()},
-                'all_valid_moves': {str(k): v for k, v in self.game_engine.get_all_valid_moves().items()}
-            }
-        }))
+        # Send initial game state (serialized payload cached between moves)
+        await websocket.send(self._game_state_payload())
+
+    def _game_state_payload(self) -> str:
+        """Serialized game_state message, re-encoded only when the engine's
+        cached snapshot has been rebuilt after a move or reset"""
+        state = self.game_engine.get_state()
+        if state is not self._state_snapshot:
+            self._state_snapshot = state
+            self._state_payload = dumps({'type': 'game_state', 'data': state})
+        return self._state_payload
         
     async def unregister(self, websocket):
         """Remove client connection"""
@@ -81,7 +124,7 @@ class GameWebSocketServer:
                     if response.get('broadcast'):
                         await self.broadcast(response['data'])
                     else:
-                        await websocket.send(json.dumps(response))
+                        await websocket.send(dumps(response))
         except websockets.exceptions.ConnectionClosed:
             pass
         except Exception as e:
@@ -139,7 +182,7 @@ class GameWebSocketServer:
                     'board': result['board_state'],  # board_state -> board
                     'current_player': result['current_player'],
                     'game_over': result['game_over'],
-                    'all_valid_moves': {str(k): v for k, v in result['all_valid_moves'].items()},
+                    'all_valid_moves': {CheckersEngine.SQ_STR[k]: v for k, v in result['all_valid_moves'].items()},
                     'piece_counts': {k: int(v) for k, v in self.game_engine.get_piece_counts().items()}  # Add missing piece counts
                 }
                 return {
@@ -162,12 +205,7 @@ class GameWebSocketServer:
                 'broadcast': True,
                 'data': {
                     'type': 'game_reset',
-                    'data': {
-                        'board': self.game_engine.board.tolist(),
-                        'current_player': int(self.game_engine.current_player),
-                        'piece_counts': {k: int(v) for k, v in self.game_engine.get_piece_counts().items()},
-                        'all_valid_moves': {str(k): v for k, v in self.game_engine.get_all_valid_moves().items()}
-                    }
+                    'data': self.game_engine.get_state()
                 }
             }
             
@@ -189,17 +227,31 @@ class GameWebSocketServer:
             
         return None
         
-    async def broadcast(self, message: Dict):
-        """Send message to all connected clients"""
-        if self.clients:
-            message_str = json.dumps(message)
-            logger.debug(f"WEBSOCKET: Broadcasting to {len(self.clients)} clients: {message.get('type', 'unknown_type')}")
-            await asyncio.gather(
-                *[client.send(message_str) for client in self.clients],
-                return_exceptions=True
-            )
+    async def broadcast(self, message):
+        """Send a message to all connected clients
+
+        Accepts either a dict (serialized to a JSON text frame) or raw bytes
+        (sent as a binary frame, used for JPEG previews).
+        """
+        if isinstance(message, (bytes, bytearray)):
+            message_str = bytes(message)
+            msg_type = 'binary'
         else:
-            logger.debug(f"WEBSOCKET: No clients connected, cannot broadcast: {message.get('type', 'unknown_type')}")
+            message_str = None
+            msg_type = message.get('type', 'unknown_type')
+
+        if not self.clients:
+            logger.debug(f"WEBSOCKET: No clients connected, cannot broadcast: {msg_type}")
+            return
+
+        if message_str is None:
+            message_str = dumps(message)
+        logger.debug(f"WEBSOCKET: Broadcasting to {len(self.clients)} clients: {msg_type}")
+
+        # websockets' own broadcast() frames the message once and writes the
+        # same bytes to every transport synchronously - no per-client
+        # coroutine/task allocation and no wait-for-ack semantics
+        websockets.broadcast(self.clients, message_str)
             
     async def start_camera_processing(self) -> bool:
         """Start processing camera frames for gesture input"""
@@ -210,13 +262,58 @@ class GameWebSocketServer:
             logger.error("Failed to initialize camera")
             return False
             
+        # Probe the capture resolution once and cache the resize decision
+        # plus a reusable destination buffer for the processing loop
+        width = int(self.camera_manager.cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+        height = int(self.camera_manager.cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+        self._resize_needed = width > 640
+        if self._resize_needed:
+            new_height = int(height * 640 / width)
+            self._resize_dims = (640, new_height)
+            self._resize_buf = np.empty((new_height, 640, 3), np.uint8)
+
+        # Warm the tracker up off the loop with a black frame so the first
+        # real frame doesn't pay MediaPipe's graph-initialization latency
+        if self._resize_needed:
+            warm_shape = (self._resize_dims[1], self._resize_dims[0], 3)
+        else:
+            warm_shape = (height, width, 3)
+        self._cv_pool.submit(self.hand_tracker.detect_hand_state,
+                             np.zeros(warm_shape, np.uint8))
+
         self.camera_manager.start_capture_thread()
         self.camera_active = True
-        
+
+        # Reader thread feeds the processing coroutine through a single-slot
+        # queue so capture and processing overlap instead of interleaving
+        self._frame_queue = asyncio.Queue(maxsize=1)
+        self._reader_thread = threading.Thread(
+            target=self._reader_loop,
+            args=(asyncio.get_running_loop(),),
+            daemon=True
+        )
+        self._reader_thread.start()
+
         # Start processing loop
         self.processing_task = asyncio.create_task(self.process_camera_frames())
         logger.info("Camera processing started")
         return True
+
+    def _reader_loop(self, loop):
+        """Pull frames from the camera and hand them to the event loop"""
+        while self.camera_active:
+            frame = self.camera_manager.get_frame()
+            if frame is not None:
+                loop.call_soon_threadsafe(self._offer_frame, frame)
+
+    def _offer_frame(self, frame):
+        """Put a frame on the queue, dropping the stale one if present"""
+        if self._frame_queue.full():
+            try:
+                self._frame_queue.get_nowait()
+            except asyncio.QueueEmpty:
+                pass
+        self._frame_queue.put_nowait(frame)
         
     async def stop_camera_processing(self):
         """Stop camera processing"""
@@ -224,6 +321,9 @@ class GameWebSocketServer:
         if self.processing_task:
             self.processing_task.cancel()
             await self.processing_task
+        if self._reader_thread:
+            self._reader_thread.join(timeout=1.0)
+            self._reader_thread = None
         self.camera_manager.stop()
         logger.info("Camera processing stopped")
         
@@ -231,82 +331,107 @@ class GameWebSocketServer:
         """Process camera frames for gesture detection"""
         while self.camera_active:
             try:
-                frame = self.camera_manager.get_frame()
-                if frame is not None:
-                    # Skip frames for better performance
-                    self.frame_skip_counter += 1
-                    if self.frame_skip_counter % self.frame_skip_rate != 0:
-                        continue
-                    
-                    # Resize frame for faster processing
-                    height, width = frame.shape[:2]
-                    if width > 640:  # Resize large frames
-                        scale = 640 / width
-                        new_width = int(width * scale)
-                        new_height = int(height * scale)
-                        frame = cv2.resize(frame, (new_width, new_height))
+                # Wait for the reader thread to deliver the newest frame;
+                # no polling sleep needed since the queue paces the loop
+                frame = await self._frame_queue.get()
+
+                # Rate pacing happens in the CameraManager capture thread
+                # via grab(), so every frame reaching this queue is processed
+                self.processed_frames += 1
+
+                # Resize + hand detection run in the CV worker thread so the
+                # event loop stays free for WebSocket I/O
+                frame, gesture = await asyncio.get_running_loop().run_in_executor(
+                    self._cv_pool, self._process_frame, frame)
+
+                # Per-frame updates are coalesced into one frame_update
+                # message at the end of the iteration
+                update = {}
+
+                if gesture:
+                    # Map to game action using board dimensions for coordinate alignment
+                    action = self.input_mapper.map_gesture_to_action(
+                        gesture,
+                        self.board_dimensions
+                    )
                     
-                    # Detect hand using simple binary tracker
-                    gesture = self.hand_tracker.detect_hand_state(frame)
+                    if action:
+                        logger.info(f"WEBSOCKET: CV action generated: {action['type']} at {action.get('position', 'N/A')}")
+                        await self.handle_cv_action(action)
+                    else:
+                        logger.debug(f"WEBSOCKET: No action generated from gesture")
                     
+                    # Send hand position for visualization (ensure serializable),
+                    # suppressing updates when the cursor barely moved, the
+                    # gesture didn't flip and the last update is recent
+                    now = time.time()
+                    pos = (float(gesture.position[0]), float(gesture.position[1])) if gesture.position else None
+                    last_pos, last_open, last_ts = self._last_hand_pos
+                    send_update = True
+                    if pos and last_pos and gesture.is_open == last_open and now - last_ts < 0.1:
+                        dx = (pos[0] - last_pos[0]) * frame.shape[1]
+                        dy = (pos[1] - last_pos[1]) * frame.shape[0]
+                        if dx * dx + dy * dy < 9:  # moved less than ~3 px
+                            send_update = False
+
+                    if send_update:
+                        self._last_hand_pos = (pos, gesture.is_open, now)
+                        update['hand'] = {
+                            'position': pos,
+                            'gesture': 'open' if gesture.is_open else 'grabbing',
+                            'confidence': float(gesture.confidence),
+                            'is_open': gesture.is_open  # Add binary state for cursor color
+                        }
+
+                # Render frame preview with debug overlays (less frequently)
+                jpeg_bytes = None
+                if len(self.clients) > 0 and self.processed_frames % self.preview_interval == 0:
+                    # Downscale, draw overlays and JPEG-encode off the event
+                    # loop (gesture positions are normalized, so the tracker
+                    # draws correctly on the 320x240 thumbnail)
+                    jpeg_bytes = await asyncio.get_running_loop().run_in_executor(
+                        self._enc_pool, self._render_preview, frame, gesture)
+
+                    # Extract debug info for simple tracker
                     if gesture:
-                        # Map to game action using board dimensions for coordinate alignment
-                        action = self.input_mapper.map_gesture_to_action(
-                            gesture,
-                            self.board_dimensions
-                        )
-                        
-                        if action:
-                            logger.info(f"WEBSOCKET: CV action generated: {action['type']} at {action.get('position', 'N/A')}")
-                            await self.handle_cv_action(action)
-                        else:
-                            logger.debug(f"WEBSOCKET: No action generated from gesture")
-                        
-                        # Send hand position for visualization (ensure serializable)
-                        await self.broadcast({
-                            'type': 'hand_position',
-                            'data': {
-                                'position': (float(gesture.position[0]), float(gesture.position[1])) if gesture.position else None,
-                                'gesture': 'open' if gesture.is_open else 'grabbing',
-                                'confidence': float(gesture.confidence),
-                                'is_open': gesture.is_open  # Add binary state for cursor color
-                            }
-                        })
-                    
-                    # Send frame preview with debug overlays (less frequently)
-                    if len(self.clients) > 0 and self.frame_skip_counter % 3 == 0:  # Every 3rd processed frame
-                        # Use simple hand tracker's debug visualization with cursor colors
-                        debug_frame = self.hand_tracker.create_debug_frame(frame, gesture)
-                        
-                        # Resize debug frame for preview
-                        preview = cv2.resize(debug_frame, (320, 240))
-                        _, buffer = cv2.imencode('.jpg', preview, [cv2.IMWRITE_JPEG_QUALITY, 60])  # Lower quality
-                        frame_base64 = base64.b64encode(buffer).decode('utf-8')
-                        
-                        # Extract debug info for simple tracker
-                        debug_info = {}
-                        if gesture:
-                            debug_info = {
-                                'is_open': gesture.is_open,
-                                'confidence': gesture.confidence,
-                                'raw_area_ratio': gesture.raw_area_ratio,
-                                'detection_method': 'simple_binary'
-                            }
-                        
-                        await self.broadcast({
-                            'type': 'camera_frame',
-                            'data': {
-                                'frame': frame_base64,
-                                'debug_info': debug_info
-                            }
-                        })
-                
-                await asyncio.sleep(0.05)   # ~20 FPS for better responsiveness
+                        update['debug_info'] = {
+                            'is_open': gesture.is_open,
+                            'confidence': gesture.confidence,
+                            'raw_area_ratio': gesture.raw_area_ratio,
+                            'detection_method': 'simple_binary'
+                        }
+                    else:
+                        update['debug_info'] = {}
+
+                # One coalesced JSON envelope per frame (hand position and/or
+                # debug info), then the JPEG preview as a raw binary frame -
+                # at most two sends instead of three
+                if update:
+                    await self.broadcast({'type': 'frame_update', 'data': update})
+                if jpeg_bytes is not None:
+                    await self.broadcast(jpeg_bytes)
                 
             except Exception as e:
                 logger.error(f"Error processing camera frame: {e}")
                 await asyncio.sleep(0.1)
                 
+    def _process_frame(self, frame):
+        """Resize and run hand detection (runs in the CV worker thread)"""
+        if self._resize_needed:
+            cv2.resize(frame, self._resize_dims, dst=self._resize_buf,
+                       interpolation=cv2.INTER_AREA)
+            frame = self._resize_buf
+        return frame, self.hand_tracker.detect_hand_state(frame)
+
+    def _render_preview(self, frame: np.ndarray, gesture) -> bytes:
+        """Downscale, draw debug overlays and JPEG-encode a preview frame
+        (runs in the encoder pool)"""
+        cv2.resize(frame, (320, 240), dst=self._preview_buf,
+                   interpolation=cv2.INTER_AREA)
+        preview = self.hand_tracker.create_debug_frame(self._preview_buf, gesture)
+        _, buffer = cv2.imencode('.jpg', preview, [cv2.IMWRITE_JPEG_QUALITY, 60])  # Lower quality
+        return buffer.tobytes()
+
     async def handle_cv_action(self, action: Dict):
         """Handle action from computer vision input"""
         action_type = action['type']
@@ -360,7 +485,7 @@ class GameWebSocketServer:
                         'board': result['board_state'],  # board_state -> board
                         'current_player': result['current_player'],
                         'game_over': result['game_over'],
-                        'all_valid_moves': {str(k): v for k, v in result['all_valid_moves'].items()},
+                        'all_valid_moves': {CheckersEngine.SQ_STR[k]: v for k, v in result['all_valid_moves'].items()},
                         'piece_counts': {k: int(v) for k, v in self.game_engine.get_piece_counts().items()}  # Add missing piece counts
                     }
                     await self.broadcast({
@@ -2,18 +2,27 @@ import cv2
 import numpy as np
 from typing import Optional, Tuple
 import threading
-import queue
 import platform
+from collections import deque
 
 class CameraManager:
     """Manages camera capture with optimized settings for hand tracking"""
     
-    def __init__(self, camera_id: int = 0):
+    def __init__(self, camera_id: int = 0, target_fps: int = 20):
         self.camera_id = camera_id
         self.cap = None
-        self.frame_queue = queue.Queue(maxsize=2)
+        # Single-slot latest-frame buffer: deque(maxlen=1) append/popleft
+        # are atomic for one producer and one consumer, so stale frames are
+        # overwritten without a lock or condvar per frame; the event lets
+        # get_frame block until a frame arrives instead of polling
+        self._latest = deque(maxlen=1)
+        self._frame_event = threading.Event()
         self.is_running = False
         self.platform = platform.system()
+        self.target_fps = target_fps
+        # Frames to skip with grab() (no demux/decode) between processed
+        # frames; derived from the native rate once the camera is open
+        self.skip_n = 0
         
     def initialize(self) -> bool:
         """Initialize camera with optimal settings for gesture detection"""
@@ -38,10 +47,22 @@ class CameraManager:
             self.cap.set(cv2.CAP_PROP_FPS, 60)
             self.cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
             
-            # Platform-specific optimizations
-            if cv2.CAP_PROP_FOURCC:
+            # Prefer uncompressed YUYV: MJPG means the camera JPEG-encodes
+            # and cap.read() pays a libjpeg decode on every frame. Fall back
+            # to MJPG when the driver can't deliver YUYV at a usable rate at
+            # this resolution (YUYV needs more USB bandwidth)
+            yuyv = cv2.VideoWriter_fourcc(*'YUYV')
+            self.cap.set(cv2.CAP_PROP_FOURCC, yuyv)
+            got_yuyv = int(self.cap.get(cv2.CAP_PROP_FOURCC)) == yuyv
+            if not got_yuyv or self.cap.get(cv2.CAP_PROP_FPS) < self.target_fps:
                 self.cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc('M', 'J', 'P', 'G'))
-                
+
+            # Capture rate above the processing rate: skip the difference
+            # with grab() so unprocessed frames are never decoded
+            native_fps = self.cap.get(cv2.CAP_PROP_FPS)
+            if native_fps and native_fps > self.target_fps:
+                self.skip_n = max(1, int(native_fps // self.target_fps) - 1)
+
             return True
         return False
     
@@ -57,21 +78,23 @@ class CameraManager:
         """Background capture loop for consistent frame rate"""
         while self.is_running:
             if self.cap and self.cap.isOpened():
+                # Advance past skipped frames without paying the decode cost
+                for _ in range(self.skip_n):
+                    self.cap.grab()
                 ret, frame = self.cap.read()
                 if ret:
-                    # Drop old frames to maintain real-time performance
-                    if self.frame_queue.full():
-                        try:
-                            self.frame_queue.get_nowait()
-                        except queue.Empty:
-                            pass
-                    self.frame_queue.put(frame)
+                    # maxlen=1 silently drops the stale frame, if any
+                    self._latest.append(frame)
+                    self._frame_event.set()
     
     def get_frame(self) -> Optional[np.ndarray]:
-        """Get latest frame from queue"""
+        """Get the latest frame, waiting briefly for one to arrive"""
+        if not self._frame_event.wait(timeout=0.1):
+            return None
+        self._frame_event.clear()
         try:
-            return self.frame_queue.get(timeout=0.1)
-        except queue.Empty:
+            return self._latest.popleft()
+        except IndexError:
             return None
             
     def stop(self):
@@ -6,17 +6,33 @@ logger = logging.getLogger(__name__)
 
 class CheckersEngine:
     """Core checkers game logic"""
-    
+
+    # Diagonal step directions, in the order get_valid_moves scans them.
+    # Class-level tuples: get_valid_moves runs per piece per broadcast, so
+    # rebuilding these lists on every call was pure allocation churn.
+    DIAG = ((-1, -1), (-1, 1), (1, -1), (1, 1))
+    _DIR_RED = ((1, -1), (1, 1))      # Red men move down the board
+    _DIR_BLACK = ((-1, -1), (-1, 1))  # Black men move up
+
+    # str((r, c)) for every square, precomputed once - the tuple-to-string
+    # key conversion otherwise runs per piece on every serialized broadcast
+    SQ_STR = {(r, c): str((r, c)) for r in range(8) for c in range(8)}
+
     def __init__(self):
-        self.board = np.zeros((8, 8), dtype=int)
+        # int8 squares: the whole board fits in a single cache line and the
+        # vectorized move masks touch 64 bytes instead of 512
+        self.board = np.zeros((8, 8), dtype=np.int8)
         self.current_player = 1  # 1: red, -1: black
         self.move_history = []
+        self._state_cache = None  # Serializable snapshot, rebuilt only after moves
+        self._board_list = None   # Python-list mirror of the board, patched per move
+        self._moves_cache = None  # Valid-move table, recomputed once per move
         self.initialize_board()
         
     def initialize_board(self):
         """Set up initial board state"""
         logger.info("GAME_ENGINE: Initializing new game board")
-        self.board = np.zeros((8, 8), dtype=int)
+        self.board = np.zeros((8, 8), dtype=np.int8)
         
         # Red pieces (player 1) - top of board
         for row in range(3):
@@ -32,55 +48,110 @@ class CheckersEngine:
                     
         self.current_player = 1
         self.move_history = []
-    
+        self._state_cache = None
+        self._board_list = self.board.tolist()
+        self._moves_cache = None
+
+    def get_state(self) -> Dict:
+        """Get a JSON-serializable snapshot of the full game state
+
+        The snapshot is cached so back-to-back broadcasts (e.g. several
+        clients connecting between moves) don't redo the numpy->Python board
+        conversion and the valid-move scan. make_move/initialize_board
+        invalidate the cache.
+        """
+        if self._state_cache is None:
+            self._state_cache = {
+                'board': self._board_list,
+                'current_player': int(self.current_player),
+                'piece_counts': {k: int(v) for k, v in self.get_piece_counts().items()},
+                'all_valid_moves': {self.SQ_STR[k]: v for k, v in self.get_all_valid_moves().items()}
+            }
+        return self._state_cache
+
     def get_valid_moves(self, position: Tuple[int, int]) -> List[Tuple[int, int]]:
         """Get all valid moves for a piece at given position"""
         row, col = position
-        piece = self.board[row][col]
-        
+        board = self.board  # Local binding avoids repeated attribute lookups
+        piece = board[row][col]
+
         if piece == 0 or piece * self.current_player <= 0:
             return []
-            
+
         moves = []
-        is_king = abs(piece) == 2
-        
-        # Determine movement directions based on piece type
-        if is_king:
-            directions = [(-1, -1), (-1, 1), (1, -1), (1, 1)]
+
+        # Movement directions by piece type (shared constant tuples)
+        if abs(piece) == 2:
+            directions = self.DIAG
         elif piece == 1:  # Red moves down
-            directions = [(1, -1), (1, 1)]
+            directions = self._DIR_RED
         else:  # Black moves up
-            directions = [(-1, -1), (-1, 1)]
-            
-        # Check regular moves and captures
+            directions = self._DIR_BLACK
+
+        # Check regular moves and captures (bounds checks inlined - this runs
+        # for every piece on every broadcast)
         for dr, dc in directions:
             # Regular move
             new_row, new_col = row + dr, col + dc
-            if self._is_valid_position(new_row, new_col) and self.board[new_row][new_col] == 0:
+            if 0 <= new_row < 8 and 0 <= new_col < 8 and board[new_row][new_col] == 0:
                 moves.append((new_row, new_col))
-                
-            # Capture move
-            mid_row, mid_col = row + dr, col + dc
+
+            # Capture move (mid square is new_row/new_col, already in bounds
+            # whenever the jump square is)
             jump_row, jump_col = row + 2*dr, col + 2*dc
-            
-            if (self._is_valid_position(jump_row, jump_col) and 
-                self._is_valid_position(mid_row, mid_col) and
-                self.board[jump_row][jump_col] == 0 and
-                self.board[mid_row][mid_col] != 0 and
-                self.board[mid_row][mid_col] * piece < 0):  # Enemy piece
+
+            if (0 <= jump_row < 8 and 0 <= jump_col < 8 and
+                board[jump_row][jump_col] == 0 and
+                board[new_row][new_col] * piece < 0):  # Enemy piece
                 moves.append((jump_row, jump_col))
-                
+
         return moves
     
     def get_all_valid_moves(self) -> Dict[Tuple[int, int], List[Tuple[int, int]]]:
-        """Get all valid moves for current player"""
+        """Get all valid moves for current player
+
+        Vectorized over the whole board: one shifted-slice comparison per
+        diagonal direction yields every regular and capture move at once,
+        instead of 64 Python-level get_valid_moves calls. Runs on every
+        register/reset/make_move, so all websocket events share the cost.
+        The table is cached until the next move mutates the board.
+        """
+        if self._moves_cache is not None:
+            return self._moves_cache
+        board = self.board
+        player = self.current_player
+        empty = board == 0
+        kings = board == 2 * player
+        men = board == player
+        enemy = board * player < 0
+
         all_moves = {}
-        for row in range(8):
-            for col in range(8):
-                if self.board[row][col] * self.current_player > 0:
-                    moves = self.get_valid_moves((row, col))
-                    if moves:
-                        all_moves[(row, col)] = moves
+        for dr, dc in self.DIAG:
+            # Men only move "forward" (dr matches their sign); kings move all
+            # four ways
+            movers = kings | men if dr == player else kings
+
+            # Regular moves: the square one diagonal step away is empty
+            sr = slice(max(0, -dr), 8 - max(0, dr))
+            sc = slice(max(0, -dc), 8 - max(0, dc))
+            step = movers[sr, sc] & empty[sr.start + dr:sr.stop + dr,
+                                          sc.start + dc:sc.stop + dc]
+            for r, c in np.argwhere(step):
+                pos = (int(r) + sr.start, int(c) + sc.start)
+                all_moves.setdefault(pos, []).append((pos[0] + dr, pos[1] + dc))
+
+            # Captures: enemy one step away, empty square two steps away
+            jr = slice(max(0, -2 * dr), 8 - max(0, 2 * dr))
+            jc = slice(max(0, -2 * dc), 8 - max(0, 2 * dc))
+            jump = (movers[jr, jc] &
+                    enemy[jr.start + dr:jr.stop + dr, jc.start + dc:jc.stop + dc] &
+                    empty[jr.start + 2 * dr:jr.stop + 2 * dr,
+                          jc.start + 2 * dc:jc.stop + 2 * dc])
+            for r, c in np.argwhere(jump):
+                pos = (int(r) + jr.start, int(c) + jc.start)
+                all_moves.setdefault(pos, []).append((pos[0] + 2 * dr, pos[1] + 2 * dc))
+
+        self._moves_cache = all_moves
         return all_moves
     
     def make_move(self, from_pos: Tuple[int, int], to_pos: Tuple[int, int]) -> Dict:
@@ -132,11 +203,20 @@ class CheckersEngine:
             'player': -self.current_player  # Previous player
         }
         self.move_history.append(move_record)
-        
+        self._state_cache = None
+        self._moves_cache = None
+
+        # Patch the Python-list mirror for just the squares that changed,
+        # instead of re-running tolist() over the whole board
+        self._board_list[from_row][from_col] = 0
+        self._board_list[to_row][to_col] = int(self.board[to_row][to_col])
+        if captured:
+            self._board_list[captured[0]][captured[1]] = 0
+
         return {
             'valid': True,
             'move': move_record,
-            'board_state': self.board.tolist(),
+            'board_state': self._board_list,
             'current_player': self.current_player,
             'game_over': self.check_game_over(),
             'all_valid_moves': self.get_all_valid_moves()
@@ -158,18 +238,9 @@ class CheckersEngine:
             logger.info("GAME_ENGINE: Game Over - Red wins (no black pieces remaining)")
             return 1  # Red wins
             
-        # Check if current player has any valid moves
-        has_moves = False
-        for row in range(8):
-            for col in range(8):
-                if self.board[row][col] * self.current_player > 0:
-                    if self.get_valid_moves((row, col)):
-                        has_moves = True
-                        break
-            if has_moves:
-                break
-                
-        if not has_moves:
+        # Check if current player has any valid moves (shares the cached
+        # move table with get_all_valid_moves/get_state)
+        if not self.get_all_valid_moves():
             winner_name = "Red" if -self.current_player == 1 else "Black"
             current_name = "Red" if self.current_player == 1 else "Black"
             logger.info(f"GAME_ENGINE: Game Over - {winner_name} wins ({current_name} has no valid moves)")
@@ -1,10 +1,34 @@
 from enum import Enum
-from typing import Optional, Tuple, Dict
+from typing import Optional, Tuple, Dict, List
+import math
 import time
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Optional Numba fast path for the per-frame coordinate mapping: one
+# compiled kernel instead of interpreted float compares and boxing. The
+# pure-Python body in _screen_to_board_coords is the fallback.
+try:
+    from numba import njit
+
+    @njit(cache=True)
+    def _map_coords(x, y, x_off, y_off, size_px, scale, board_size):
+        if x < x_off or x > x_off + size_px or y < y_off or y > y_off + size_px:
+            return -1, -1
+        board_x = int((x - x_off) * scale)
+        board_y = int((y - y_off) * scale)
+        if 0 <= board_x < board_size and 0 <= board_y < board_size:
+            return board_y, board_x
+        return -1, -1
+except ImportError:
+    _map_coords = None
+
+# Interned (row, col) tuples for the 64 board squares: every frame that
+# lands on the board returns one of these instead of allocating a fresh
+# tuple, which also makes downstream equality checks identity-fast
+_COORDS = tuple(tuple((r, c) for c in range(8)) for r in range(8))
+
 class GameAction(Enum):
     SELECT_PIECE = "select_piece"
     MOVE_PIECE = "move_piece"
@@ -12,6 +36,52 @@ class GameAction(Enum):
     CANCEL = "cancel"
     CONFIRM = "confirm"
 
+# Enum .value goes through descriptor machinery on every access; bind the
+# strings once for the per-frame action dicts (the Enum stays the public API)
+_ACT_SELECT = GameAction.SELECT_PIECE.value
+_ACT_MOVE = GameAction.MOVE_PIECE.value
+_ACT_HOVER = GameAction.HOVER.value
+_ACT_CANCEL = GameAction.CANCEL.value
+
+class OneEuroFilter:
+    """1-euro filter (Casiez et al.) for a noisy scalar signal
+
+    The cutoff adapts to speed: slow movement is smoothed hard (killing the
+    jitter that flickers hover cells at boundaries) while fast movement
+    tracks with minimal lag.
+    """
+
+    def __init__(self, min_cutoff: float = 1.0, beta: float = 0.007,
+                 d_cutoff: float = 1.0):
+        self.min_cutoff = min_cutoff
+        self.beta = beta
+        self.d_cutoff = d_cutoff
+        self._prev_x = None
+        self._prev_dx = 0.0
+        self._prev_t = None
+
+    @staticmethod
+    def _alpha(cutoff: float, dt: float) -> float:
+        tau = 1.0 / (2.0 * math.pi * cutoff)
+        return 1.0 / (1.0 + tau / dt)
+
+    def __call__(self, x: float, t: float) -> float:
+        if self._prev_t is None:
+            self._prev_x = x
+            self._prev_t = t
+            return x
+        dt = t - self._prev_t
+        if dt <= 0.0:
+            return self._prev_x
+        dx = (x - self._prev_x) / dt
+        a_d = self._alpha(self.d_cutoff, dt)
+        dx_hat = a_d * dx + (1.0 - a_d) * self._prev_dx
+        cutoff = self.min_cutoff + self.beta * abs(dx_hat)
+        a = self._alpha(cutoff, dt)
+        x_hat = a * x + (1.0 - a) * self._prev_x
+        self._prev_x, self._prev_dx, self._prev_t = x_hat, dx_hat, t
+        return x_hat
+
 class InputMapper:
     """Maps computer vision input to game actions"""
     
@@ -24,17 +94,57 @@ class InputMapper:
         self.drag_start_position = None  # Track start position of drag for moves
         self.last_action_time = 0
         self.action_cooldown = 0.2  # Faster response for binary gestures
-        self.hover_history = []  # Store recent hover positions for stability
-        self.hover_stability_threshold = 2  # Reduced for faster hover response
-        
+
         # Binary gesture state tracking
         self.is_hand_closed = False  # Track if hand is currently closed (grabbing)
         self.was_grabbing = False    # Track previous grabbing state
         self.gesture_stability_count = 0  # Count frames for gesture stability
         self.gesture_stability_threshold = 8  # Require more stability for state changes
-        self.gesture_history = []  # Track recent gesture states
-        self.gesture_history_size = 15  # Look at more frames for stability
-        
+        # Vote window bit-packed into one int: each detection shifts in as
+        # the low bit, the mask truncates to the last `threshold` frames,
+        # and int.bit_count() tallies closed votes in a single instruction
+        self._gesture_bits = 0
+        self._gesture_mask = (1 << self.gesture_stability_threshold) - 1
+        self._gesture_seen = 0  # Frames observed, capped at the threshold
+        # 75% majority threshold as pure integer math: ceil(3t/4) without
+        # the float multiply/boxing (equals (3t + 3) // 4 for integer t)
+        self._stable_min = (self.gesture_stability_threshold * 3 + 3) // 4
+        # Board geometry derived from screen dimensions, memoized since the
+        # dimensions only change when the frontend resizes the board
+        self._geom_dims = None
+        self._geom = None
+        # Reused hover action dict - hover is the only action emitted at
+        # frame rate, and the caller serializes it before the next gesture
+        # is mapped, so mutating in place is safe and skips a dict
+        # allocation per emission
+        self._hover_action = {'type': _ACT_HOVER, 'position': None, 'confidence': 0.0}
+        # 1-euro filters smoothing the normalized hand position before it is
+        # quantized to board cells
+        self._euro_x = OneEuroFilter(min_cutoff=1.0, beta=0.007)
+        self._euro_y = OneEuroFilter(min_cutoff=1.0, beta=0.007)
+        # hand_closed extractor per gesture class: the attribute probing
+        # runs once per class, then each frame is one dict lookup + call
+        self._decoders = {}
+        
+    @staticmethod
+    def _build_decoder(gesture):
+        """Pick the hand_closed extractor matching this gesture's shape"""
+        if hasattr(gesture, 'is_open'):
+            # New simple binary detection: is_open=False means grabbing
+            return lambda g: not g.is_open
+        if hasattr(gesture, 'finger_count'):
+            # Legacy finger count: only a fully closed fist counts as closed
+            def decode(g):
+                finger_count = g.finger_count
+                if finger_count is None:
+                    return g.gesture_type == 'grab'
+                if hasattr(finger_count, 'item'):  # numpy scalar
+                    finger_count = finger_count.item()
+                return int(finger_count) == 0
+            return decode
+        # Fallback to gesture type analysis
+        return lambda g: g.gesture_type == 'grab'
+
     def update_game_state(self, selected_piece_position: Optional[Tuple[int, int]]):
         """Update internal state to match game state - critical for gesture flow"""
         if self.selected_piece != selected_piece_position:
@@ -43,46 +153,82 @@ class InputMapper:
         
     def map_gesture_to_action(self, gesture, screen_dimensions: Tuple[int, int]) -> Optional[Dict]:
         """Convert gesture to game action replicating exact mouse behavior"""
-        
-        logger.debug(f"INPUT_MAPPER: Processing gesture - Type: {type(gesture).__name__}")
-        
-        try:
-            # Check if using new SimpleHandGesture
-            if hasattr(gesture, 'is_open'):
-                # New simple binary detection
-                hand_closed = not gesture.is_open  # is_open=False means hand is closed (grabbing)
-                logger.debug(f"INPUT_MAPPER: Simple binary gesture - "
-                          f"is_open={gesture.is_open}, hand_closed={hand_closed}")
-            elif hasattr(gesture, 'finger_count') and gesture.finger_count is not None:
-                # Legacy finger count detection
-                finger_count = gesture.finger_count
-                if hasattr(finger_count, 'item'):  # numpy scalar
-                    finger_count = finger_count.item()
-                hand_closed = int(finger_count) == 0  # Only fully closed fist = closed, any fingers = open
-                logger.debug(f"INPUT_MAPPER: Legacy finger count - {finger_count} fingers -> {'closed' if hand_closed else 'open'}")
-            else:
-                # Fallback to gesture type analysis
-                hand_closed = gesture.gesture_type == 'grab'
-                logger.debug(f"INPUT_MAPPER: Fallback gesture type - {gesture.gesture_type} -> {'closed' if hand_closed else 'open'}")
-        except Exception as e:
-            logger.error(f"INPUT_MAPPER: Error determining hand state: {e}")
-            # Safe fallback - assume open hand
-            hand_closed = False
-        
+        return self.map_gestures_batch((gesture,), screen_dimensions)[-1]
+
+    def map_gestures_batch(self, gestures, screen_dimensions: Tuple[int, int]) -> List[Optional[Dict]]:
+        """Map a batch of queued gestures to actions in one call
+
+        Lets the ingest layer drain accumulated frames without re-entering
+        the mapper per frame: hand_closed is decoded for the whole batch up
+        front, then the (inherently sequential) state machine runs over the
+        precomputed bits. Returns one entry per gesture, None where no
+        action fired.
+        """
+        closed_bits = []
+        for gesture in gestures:
+            try:
+                # Resolve the gesture's shape once per class; afterwards
+                # each frame is one dict lookup instead of hasattr probes
+                decoder = self._decoders.get(type(gesture))
+                if decoder is None:
+                    decoder = self._build_decoder(gesture)
+                    self._decoders[type(gesture)] = decoder
+                closed_bits.append(decoder(gesture))
+            except Exception as e:
+                logger.error(f"INPUT_MAPPER: Error determining hand state: {e}")
+                # Safe fallback - assume open hand
+                closed_bits.append(False)
+        return [self._map_single(g, hc, screen_dimensions)
+                for g, hc in zip(gestures, closed_bits)]
+
+    def _map_single(self, gesture, hand_closed: bool,
+                    screen_dimensions: Tuple[int, int]) -> Optional[Dict]:
+        """Run the gesture state machine for one frame"""
+
+        logger.debug("INPUT_MAPPER: Processing gesture - Type: %s, hand_closed=%s",
+                     type(gesture).__name__, hand_closed)
+
         # Update hand state with stability checking
         hand_state_changed = self._update_hand_state(hand_closed)
-        
+
+        # Monotonic clock: debounce intervals must not jump when the wall
+        # clock is adjusted (NTP step, DST), and monotonic() is also cheaper
+        current_time = time.monotonic()
+
+        # Smooth the normalized position before quantizing to cells: the
+        # raw coords jitter across cell boundaries, and every spurious
+        # transition costs a hover emission downstream
+        position = gesture.position
+        if position:
+            position = (self._euro_x(position[0], current_time),
+                        self._euro_y(position[1], current_time))
+
         # Map hand position to board coordinates
-        logger.debug(f"INPUT_MAPPER: Gesture position: {gesture.position}, Screen dimensions: {screen_dimensions}")
-        board_pos = self._screen_to_board_coords(gesture.position, screen_dimensions)
-        
-        logger.debug(f"INPUT_MAPPER: State tracking - "
-                   f"current_closed={self.is_hand_closed}, "
-                   f"was_grabbing={self.was_grabbing}, "
-                   f"state_changed={hand_state_changed}, "
-                   f"board_pos={board_pos}, "
-                   f"selected_piece={self.selected_piece}")
-        
+        logger.debug("INPUT_MAPPER: Gesture position: %s, Screen dimensions: %s",
+                     position, screen_dimensions)
+        board_pos = self._screen_to_board_coords(position, screen_dimensions)
+
+        # Duplicate-hover short-circuit: a steady open hand lands on the
+        # same (interned) cell frame after frame, so an identity check
+        # against the current hover cell skips the rest of the pipeline.
+        # Gated on a full stability window so startup behaviour is unchanged
+        if (not hand_state_changed and not self.is_hand_closed and
+                board_pos is self.hover_position and board_pos is not None and
+                self._gesture_seen >= self.gesture_stability_threshold):
+            return None
+
+        logger.debug("INPUT_MAPPER: State tracking - current_closed=%s, was_grabbing=%s, "
+                     "state_changed=%s, board_pos=%s, selected_piece=%s",
+                     self.is_hand_closed, self.was_grabbing, hand_state_changed,
+                     board_pos, self.selected_piece)
+        
+        # Mid-drag fast path: the hand stayed closed, so no transition can
+        # fire and hover is suppressed anyway - just track the drag position
+        if not hand_state_changed and self.is_hand_closed:
+            if board_pos:
+                self.last_valid_position = board_pos
+            return None
+
         # EXACT MOUSE BEHAVIOR REPLICATION:
         # 1. OPEN hand = mouse movement (hover)
         # 2. OPEN→GRABBED = mouse click down (select piece) 
@@ -90,7 +236,6 @@ class InputMapper:
         # 4. GRABBED→OPEN = mouse release (move piece or deselect)
         
         # Debounce major actions (selection/movement)
-        current_time = time.time()
         if current_time - self.last_action_time < self.action_cooldown and hand_state_changed:
             return None
         
@@ -113,7 +258,7 @@ class InputMapper:
                     # If no piece currently selected, select piece immediately 
                     if not self.selected_piece:
                         action = {
-                            'type': GameAction.SELECT_PIECE.value,
+                            'type': _ACT_SELECT,
                             'position': board_pos,
                             'confidence': gesture.confidence
                         }
@@ -121,7 +266,7 @@ class InputMapper:
                         return action
                     # If piece is already selected, we're starting a move - handle on release
                     else:
-                        logger.debug(f"INPUT_MAPPER: Piece already selected {self.selected_piece}, waiting for release")
+                        logger.debug("INPUT_MAPPER: Piece already selected %s, waiting for release", self.selected_piece)
                     
             elif not self.is_hand_closed and self.was_grabbing:
                 # GRABBED→OPEN: Equivalent to mouse release
@@ -139,7 +284,7 @@ class InputMapper:
                         logger.info(f"INPUT_MAPPER: Selecting piece at {release_pos}")
                         self.last_action_time = current_time
                         return {
-                            'type': GameAction.SELECT_PIECE.value, 
+                            'type': _ACT_SELECT, 
                             'position': release_pos,
                             'confidence': gesture.confidence
                         }
@@ -148,13 +293,13 @@ class InputMapper:
                     if release_pos:
                         if release_pos == self.selected_piece:
                             # Released on same piece - keep selected (like mouse)
-                            logger.debug(f"INPUT_MAPPER: Maintaining selection of {self.selected_piece}")
+                            logger.debug("INPUT_MAPPER: Maintaining selection of %s", self.selected_piece)
                             return None
                         else:
                             # Released on different square - attempt move or reselect
                             logger.info(f"INPUT_MAPPER: Move attempt from {self.selected_piece} to {release_pos}")
                             action = {
-                                'type': GameAction.MOVE_PIECE.value,
+                                'type': _ACT_MOVE,
                                 'from': self.selected_piece,
                                 'to': release_pos,
                                 'confidence': gesture.confidence
@@ -169,7 +314,7 @@ class InputMapper:
                         self.selected_piece = None
                         self.last_action_time = current_time
                         return {
-                            'type': GameAction.CANCEL.value,
+                            'type': _ACT_CANCEL,
                             'confidence': gesture.confidence
                         }
         
@@ -178,42 +323,41 @@ class InputMapper:
             self.last_valid_position = board_pos
         
         # Continuous hover feedback (replicating mouse movement)
-        # Only send hover events when hand is open (not dragging) - just like mouse hover
+        # Only send hover events when hand is open (not dragging) - just
+        # like mouse hover. The 1-euro filter already smooths the coords
+        # before quantization, so a hover fires whenever the cell changes -
+        # no majority-vote history needed on top
         if not self.is_hand_closed:
-            stable_pos = self._get_stable_hover_position(board_pos)
-            if stable_pos and stable_pos != self.hover_position:
-                self.hover_position = stable_pos
-                return {
-                    'type': GameAction.HOVER.value,
-                    'position': stable_pos,
-                    'confidence': gesture.confidence
-                }
-        
+            if board_pos and board_pos is not self.hover_position:
+                self.hover_position = board_pos
+                action = self._hover_action
+                action['position'] = board_pos
+                action['confidence'] = gesture.confidence
+                return action
+
         return None
     
     def _update_hand_state(self, hand_closed: bool) -> bool:
         """Update hand state with enhanced stability checking"""
         
-        # Add current detection to history
-        self.gesture_history.append(hand_closed)
-        
-        # Keep history at manageable size
-        if len(self.gesture_history) > self.gesture_history_size:
-            self.gesture_history.pop(0)
-        
+        # Shift the new detection into the bit-packed window; the mask drops
+        # the vote falling off the far end
+        self._gesture_bits = ((self._gesture_bits << 1) | hand_closed) & self._gesture_mask
+
         # Need enough history to make a decision
-        if len(self.gesture_history) < self.gesture_stability_threshold:
-            logger.debug(f"INPUT_MAPPER: Building gesture history {len(self.gesture_history)}/{self.gesture_stability_threshold}")
-            return False
-        
-        # Count recent detections
-        recent_detections = self.gesture_history[-self.gesture_stability_threshold:]
-        closed_count = sum(recent_detections)
-        open_count = len(recent_detections) - closed_count
+        if self._gesture_seen < self.gesture_stability_threshold:
+            self._gesture_seen += 1
+            if self._gesture_seen < self.gesture_stability_threshold:
+                logger.debug("INPUT_MAPPER: Building gesture history %d/%d",
+                             self._gesture_seen, self.gesture_stability_threshold)
+                return False
+
+        closed_count = self._gesture_bits.bit_count()
+        open_count = self.gesture_stability_threshold - closed_count
         
-        # Determine stable state based on majority vote
-        stable_closed = closed_count >= (self.gesture_stability_threshold * 0.75)  # 75% threshold
-        stable_open = open_count >= (self.gesture_stability_threshold * 0.75)
+        # Determine stable state based on majority vote (75% threshold)
+        stable_closed = closed_count >= self._stable_min
+        stable_open = open_count >= self._stable_min
         
         # Only change state if we have a strong majority
         if stable_closed and not self.is_hand_closed:
@@ -228,30 +372,10 @@ class InputMapper:
             return True
         
         # No stable state change
-        logger.debug(f"INPUT_MAPPER: No state change - closed_votes:{closed_count}, open_votes:{open_count}, current_closed:{self.is_hand_closed}")
+        logger.debug("INPUT_MAPPER: No state change - closed_votes:%d, open_votes:%d, current_closed:%s",
+                     closed_count, open_count, self.is_hand_closed)
         return False
     
-    def _get_stable_hover_position(self, board_pos: Optional[Tuple[int, int]]) -> Optional[Tuple[int, int]]:
-        """Get stable hover position to reduce flickering"""
-        # Add current position to history
-        self.hover_history.append(board_pos)
-        
-        # Keep only recent positions
-        if len(self.hover_history) > 10:
-            self.hover_history.pop(0)
-        
-        if not board_pos:
-            return None
-        
-        # Count occurrences of the current position
-        count = sum(1 for pos in self.hover_history if pos == board_pos)
-        
-        # Return position only if it's stable enough
-        if count >= min(self.hover_stability_threshold, len(self.hover_history)):
-            return board_pos
-        
-        return None
-    
     def _screen_to_board_coords(self, screen_pos: Tuple[float, float],
                                 screen_dims: Tuple[int, int]) -> Optional[Tuple[int, int]]:
         """Convert screen coordinates to board grid position
@@ -269,35 +393,50 @@ class InputMapper:
         x = norm_x * width
         y = norm_y * height
         
-        logger.debug(f"INPUT_MAPPER: _screen_to_board_coords - Normalized: ({norm_x:.3f}, {norm_y:.3f}) -> Pixels: ({x:.1f}, {y:.1f}), Screen: ({width}, {height})")
-        
-        # Define board area - matches Board.js logic exactly (lines 34-35)
-        # The board uses the full canvas size, not 80% of it
-        board_size_pixels = min(width, height)
-        board_x_offset = (width - board_size_pixels) / 2
-        board_y_offset = (height - board_size_pixels) / 2
-        
-        logger.debug(f"INPUT_MAPPER: Board area - size:{board_size_pixels:.1f}px, x_offset:{board_x_offset:.1f}, y_offset:{board_y_offset:.1f}")
+        logger.debug("INPUT_MAPPER: _screen_to_board_coords - Normalized: (%.3f, %.3f) -> Pixels: (%.1f, %.1f), Screen: (%s, %s)",
+                     norm_x, norm_y, x, y, width, height)
+        
+        # Define board area - matches Board.js logic exactly (lines 34-35).
+        # The board uses the full canvas size, not 80% of it. Geometry is
+        # memoized per screen_dims; the reciprocal scale turns the per-frame
+        # divide into a multiply
+        if screen_dims != self._geom_dims:
+            board_size_pixels = min(width, height)
+            self._geom = (board_size_pixels,
+                          (width - board_size_pixels) / 2,
+                          (height - board_size_pixels) / 2,
+                          self.board_size / board_size_pixels)
+            self._geom_dims = screen_dims
+        board_size_pixels, board_x_offset, board_y_offset, scale = self._geom
+
+        if _map_coords is not None:
+            # Compiled kernel: bounds checks and grid mapping in one call
+            row, col = _map_coords(x, y, board_x_offset, board_y_offset,
+                                   board_size_pixels, scale, self.board_size)
+            return None if row < 0 else _COORDS[row][col]
+
+        logger.debug("INPUT_MAPPER: Board area - size:%.1fpx, x_offset:%.1f, y_offset:%.1f",
+                     board_size_pixels, board_x_offset, board_y_offset)
         
         # Check if position is within board area
         if (x < board_x_offset or x > board_x_offset + board_size_pixels or
             y < board_y_offset or y > board_y_offset + board_size_pixels):
-            logger.debug(f"INPUT_MAPPER: Position outside board area - "
-                       f"x:{x:.1f} not in [{board_x_offset:.1f}, {board_x_offset + board_size_pixels:.1f}], "
-                       f"y:{y:.1f} not in [{board_y_offset:.1f}, {board_y_offset + board_size_pixels:.1f}]")
+            logger.debug("INPUT_MAPPER: Position outside board area - x:%.1f not in [%.1f, %.1f], y:%.1f not in [%.1f, %.1f]",
+                         x, board_x_offset, board_x_offset + board_size_pixels,
+                         y, board_y_offset, board_y_offset + board_size_pixels)
             return None
         
         # Normalize to board coordinates
-        board_x = int((x - board_x_offset) / board_size_pixels * self.board_size)
-        board_y = int((y - board_y_offset) / board_size_pixels * self.board_size)
+        board_x = int((x - board_x_offset) * scale)
+        board_y = int((y - board_y_offset) * scale)
         
-        logger.debug(f"INPUT_MAPPER: Calculated board coords - board_x:{board_x}, board_y:{board_y}")
+        logger.debug("INPUT_MAPPER: Calculated board coords - board_x:%d, board_y:%d", board_x, board_y)
         
         # Validate bounds
         if 0 <= board_x < self.board_size and 0 <= board_y < self.board_size:
-            result = (board_y, board_x)  # Return as (row, col)
-            logger.debug(f"INPUT_MAPPER: Valid board position: {result}")
+            result = _COORDS[board_y][board_x]  # Return as (row, col)
+            logger.debug("INPUT_MAPPER: Valid board position: %s", result)
             return result
         
-        logger.debug(f"INPUT_MAPPER: Board coords out of bounds - board_x:{board_x}, board_y:{board_y}")
+        logger.debug("INPUT_MAPPER: Board coords out of bounds - board_x:%d, board_y:%d", board_x, board_y)
         return None
\ No newline at end of file
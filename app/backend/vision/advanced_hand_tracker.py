@@ -16,7 +16,29 @@ class AdvancedHandTracker:
     """Advanced hand tracking using multiple techniques for improved accuracy"""
     
     def __init__(self):
-        self.background_subtractor = cv2.createBackgroundSubtractorMOG2(detectShadows=False)
+        # Short history keeps the per-pixel mixture model update cheap (a
+        # hand moves constantly, so long-term background memory buys
+        # nothing), and the raised variance threshold suppresses sensor
+        # noise that would otherwise need extra morphology downstream
+        self.background_subtractor = cv2.createBackgroundSubtractorMOG2(
+            history=120, varThreshold=25, detectShadows=False)
+        # All three pipelines run on a frame downscaled to this size; the
+        # morphology/cvtColor/Canny passes are memory-bound, so touching
+        # ~4x fewer pixels is a near-linear win. Contours are scaled back
+        # to frame coordinates before analysis
+        self.work_size = (320, 240)
+        # BGR -> skin-bit lookup table (16 MB, built once): collapses the
+        # HSV + YCrCb conversions, two inRange passes and the bitwise_and
+        # into a single gather per frame
+        self.skin_lut = self._build_skin_lut()
+        # Morphology kernels, allocated once instead of per frame
+        self._kernel_ellipse5 = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (5, 5))
+        self._kernel_3 = np.ones((3, 3), np.uint8)
+        self._kernel_5 = np.ones((5, 5), np.uint8)
+        # Intermediate image buffers reused across frames (keyed by name;
+        # reallocated only if the working shape changes) so cvtColor /
+        # morphology / Canny write into warm memory instead of allocating
+        self._bufs = {}
         self.last_position = None
         self.movement_threshold = 30
         self.calibration_frames = []
@@ -33,15 +55,46 @@ class AdvancedHandTracker:
             
     def detect_hands(self, frame: np.ndarray) -> Optional[Dict]:
         """Detect hand using multiple advanced techniques"""
-        
+
+        # Downscale once and share the small frame across all three
+        # pipelines; each detector scales its contours back up so the
+        # size/shape filters and downstream analysis stay in frame pixels
+        h, w = frame.shape[:2]
+        if (w, h) != self.work_size:
+            small = self._get_buf('small', (self.work_size[1], self.work_size[0], 3))
+            cv2.resize(frame, self.work_size, dst=small,
+                       interpolation=cv2.INTER_AREA)
+            scale = np.array([w / self.work_size[0], h / self.work_size[1]],
+                             dtype=np.float32)
+        else:
+            small = frame
+            scale = None
+
+        # One shared grayscale conversion: MOG2 accepts single-channel
+        # input (it would convert internally anyway) and the edge detector
+        # starts from gray, so neither pays its own cvtColor
+        gray = self._get_buf('gray', small.shape[:2])
+        cv2.cvtColor(small, cv2.COLOR_BGR2GRAY, dst=gray)
+
         # Technique 1: Motion-based detection with background subtraction
-        motion_contours = self._detect_motion_based(frame)
-        
-        # Technique 2: Improved skin detection with calibration
-        skin_contours = self._detect_skin_advanced(frame)
-        
-        # Technique 3: Edge-based hand detection
-        edge_contours = self._detect_edge_based(frame)
+        motion_contours, fg_count = self._detect_motion_based(gray, scale)
+
+        # Static-scene fast path: with essentially no foreground pixels
+        # there is no hand to find, so skip the skin and edge pipelines.
+        # If a hand was being tracked it may simply be holding still, so
+        # skin detection (which doesn't need motion) still runs, but the
+        # noisier edge pass is skipped
+        if fg_count < 0.001 * gray.size:
+            if self.last_position is None:
+                return None
+            skin_contours = self._detect_skin_advanced(small, scale)
+            edge_contours = []
+        else:
+            # Technique 2: Improved skin detection with calibration (needs BGR)
+            skin_contours = self._detect_skin_advanced(small, scale)
+
+            # Technique 3: Edge-based hand detection
+            edge_contours = self._detect_edge_based(gray, scale)
         
         # Combine and filter results
         all_candidates = []
@@ -69,19 +122,55 @@ class AdvancedHandTracker:
         
         return best_candidate
         
-    def _detect_motion_based(self, frame: np.ndarray) -> List[np.ndarray]:
-        """Detect moving objects (likely hands)"""
-        # Apply background subtraction
-        fg_mask = self.background_subtractor.apply(frame)
-        
-        # Clean up the mask
-        kernel = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (5, 5))
-        fg_mask = cv2.morphologyEx(fg_mask, cv2.MORPH_OPEN, kernel)
-        fg_mask = cv2.morphologyEx(fg_mask, cv2.MORPH_CLOSE, kernel)
-        
-        # Find contours
-        contours, _ = cv2.findContours(fg_mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
-        
+    def _get_buf(self, name: str, shape, dtype=np.uint8) -> np.ndarray:
+        """Fetch (or lazily allocate) a named reusable image buffer"""
+        buf = self._bufs.get(name)
+        if buf is None or buf.shape != tuple(shape):
+            buf = np.empty(shape, dtype)
+            self._bufs[name] = buf
+        return buf
+
+    @staticmethod
+    def _simplify_contour(contour: np.ndarray) -> np.ndarray:
+        """Reduce contour point count before the O(N) analysis stages
+
+        convexHull/convexityDefects/moments all iterate every point; a
+        mild approxPolyDP cuts N several-fold with no visible change to
+        hand-sized blobs.
+        """
+        peri = cv2.arcLength(contour, True)
+        return cv2.approxPolyDP(contour, 0.003 * peri, True)
+
+    @staticmethod
+    def _upscale_contours(contours, scale) -> List[np.ndarray]:
+        """Map contours from work-size coordinates back to frame pixels"""
+        if scale is None:
+            return list(contours)
+        return [(contour * scale).astype(np.int32) for contour in contours]
+
+    def _detect_motion_based(self, gray: np.ndarray, scale=None) -> Tuple[List[np.ndarray], int]:
+        """Detect moving objects (likely hands)
+
+        Returns the filtered contours plus the foreground pixel count of
+        the cleaned mask, which detect_hands uses to skip the other
+        pipelines on static scenes.
+        """
+        # Apply background subtraction into a reused mask buffer
+        fg_mask = self.background_subtractor.apply(
+            gray, self._get_buf('fg_mask', gray.shape[:2]))
+
+        # Clean up the mask (ping-pong between two reused buffers)
+        kernel = self._kernel_ellipse5
+        tmp = self._get_buf('fg_tmp', gray.shape[:2])
+        cv2.morphologyEx(fg_mask, cv2.MORPH_OPEN, kernel, dst=tmp)
+        cv2.morphologyEx(tmp, cv2.MORPH_CLOSE, kernel, dst=fg_mask)
+        fg_count = cv2.countNonZero(fg_mask)
+
+        # Find contours (scaled back up so the area thresholds below keep
+        # their frame-pixel meaning)
+        contours, _ = cv2.findContours(fg_mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_TC89_KCOS)
+        contours = self._upscale_contours(contours, scale)
+
         # Filter by size and shape
         filtered_contours = []
         for contour in contours:
@@ -93,63 +182,95 @@ class AdvancedHandTracker:
                 solidity = area / hull_area if hull_area > 0 else 0
                 
                 if 0.5 < solidity < 0.95:  # Hands have moderate solidity
-                    filtered_contours.append(contour)
-                    
-        return filtered_contours
-        
-    def _detect_skin_advanced(self, frame: np.ndarray) -> List[np.ndarray]:
-        """Advanced skin detection with multiple color spaces"""
-        
-        # Convert to multiple color spaces
-        hsv = cv2.cvtColor(frame, cv2.COLOR_BGR2HSV)
-        ycrcb = cv2.cvtColor(frame, cv2.COLOR_BGR2YCrCb)
+                    filtered_contours.append(self._simplify_contour(contour))
+
+        return filtered_contours, fg_count
         
+    @staticmethod
+    def _build_skin_lut() -> np.ndarray:
+        """Precompute the fused HSV & YCrCb skin mask for every BGR value
+
+        Enumerates all 256^3 colors once (a few hundred ms at startup) so
+        per-frame classification becomes one table gather instead of two
+        cvtColor passes, two inRange passes and a bitwise_and.
+        """
+        idx = np.arange(256 ** 3, dtype=np.uint32)
+        bgr = np.empty((idx.size, 1, 3), dtype=np.uint8)
+        bgr[:, 0, 0] = idx >> 16
+        bgr[:, 0, 1] = (idx >> 8) & 255
+        bgr[:, 0, 2] = idx & 255
+        del idx
+
         # HSV skin detection (improved ranges)
-        lower_hsv = np.array([0, 20, 70], dtype=np.uint8)
-        upper_hsv = np.array([20, 255, 255], dtype=np.uint8)
-        mask_hsv = cv2.inRange(hsv, lower_hsv, upper_hsv)
-        
+        hsv = cv2.cvtColor(bgr, cv2.COLOR_BGR2HSV)
+        mask_hsv = cv2.inRange(hsv,
+                               np.array([0, 20, 70], dtype=np.uint8),
+                               np.array([20, 255, 255], dtype=np.uint8))
+        del hsv
+
         # YCrCb skin detection (more robust)
-        lower_ycrcb = np.array([0, 133, 77], dtype=np.uint8)
-        upper_ycrcb = np.array([255, 173, 127], dtype=np.uint8)
-        mask_ycrcb = cv2.inRange(ycrcb, lower_ycrcb, upper_ycrcb)
-        
-        # Combine masks
-        skin_mask = cv2.bitwise_and(mask_hsv, mask_ycrcb)
-        
-        # Advanced filtering
-        kernel = np.ones((3, 3), np.uint8)
-        skin_mask = cv2.morphologyEx(skin_mask, cv2.MORPH_OPEN, kernel, iterations=2)
-        skin_mask = cv2.morphologyEx(skin_mask, cv2.MORPH_CLOSE, kernel, iterations=2)
-        
+        ycrcb = cv2.cvtColor(bgr, cv2.COLOR_BGR2YCrCb)
+        mask_ycrcb = cv2.inRange(ycrcb,
+                                 np.array([0, 133, 77], dtype=np.uint8),
+                                 np.array([255, 173, 127], dtype=np.uint8))
+        del bgr, ycrcb
+
+        return (mask_hsv & mask_ycrcb).ravel()
+
+    def _detect_skin_advanced(self, frame: np.ndarray, scale=None) -> List[np.ndarray]:
+        """Advanced skin detection with multiple color spaces"""
+
+        # Pack each BGR pixel into a table index and gather the fused
+        # skin bit - one pass over the frame instead of four. Both the
+        # index array and the mask live in reused buffers
+        shape = frame.shape[:2]
+        idx = self._get_buf('skin_idx', shape, np.uint32)
+        np.copyto(idx, frame[..., 0], casting='unsafe')
+        idx <<= 8
+        idx |= frame[..., 1]
+        idx <<= 8
+        idx |= frame[..., 2]
+        skin_mask = self._get_buf('skin_mask', shape)
+        np.take(self.skin_lut, idx, out=skin_mask)
+
+        # Advanced filtering (ping-pong between the two mask buffers)
+        kernel = self._kernel_3
+        tmp = self._get_buf('skin_tmp', shape)
+        cv2.morphologyEx(skin_mask, cv2.MORPH_OPEN, kernel, dst=tmp, iterations=2)
+        cv2.morphologyEx(tmp, cv2.MORPH_CLOSE, kernel, dst=skin_mask, iterations=2)
+
         # Remove small noise
-        kernel = np.ones((5, 5), np.uint8)
-        skin_mask = cv2.morphologyEx(skin_mask, cv2.MORPH_OPEN, kernel)
-        
+        cv2.morphologyEx(skin_mask, cv2.MORPH_OPEN, self._kernel_5, dst=tmp)
+
         # Find contours
-        contours, _ = cv2.findContours(skin_mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
-        
-        return contours
-        
-    def _detect_edge_based(self, frame: np.ndarray) -> List[np.ndarray]:
-        """Detect hands using edge detection and shape analysis"""
-        
-        # Convert to grayscale
-        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        contours, _ = cv2.findContours(tmp, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_TC89_KCOS)
+
+        return [self._simplify_contour(c)
+                for c in self._upscale_contours(contours, scale)]
         
+    def _detect_edge_based(self, gray: np.ndarray, scale=None) -> List[np.ndarray]:
+        """Detect hands using edge detection and shape analysis
+
+        Takes the grayscale working frame prepared by detect_hands.
+        """
+        shape = gray.shape[:2]
+
         # Apply Gaussian blur
-        blurred = cv2.GaussianBlur(gray, (5, 5), 0)
-        
+        blurred = self._get_buf('blurred', shape)
+        cv2.GaussianBlur(gray, (5, 5), 0, dst=blurred)
+
         # Edge detection
-        edges = cv2.Canny(blurred, 50, 150)
-        
-        # Dilate edges to connect broken lines
-        kernel = np.ones((3, 3), np.uint8)
-        edges = cv2.dilate(edges, kernel, iterations=1)
-        
-        # Find contours
-        contours, _ = cv2.findContours(edges, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
-        
+        edges = self._get_buf('edges', shape)
+        cv2.Canny(blurred, 50, 150, edges=edges)
+
+        # Dilate edges to connect broken lines (blurred is free again,
+        # reuse it as the dilation target)
+        cv2.dilate(edges, self._kernel_3, dst=blurred, iterations=1)
+
+        # Find contours (back in frame coordinates before the size filter)
+        contours, _ = cv2.findContours(blurred, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_TC89_KCOS)
+        contours = self._upscale_contours(contours, scale)
+
         # Filter by size and complexity
         filtered_contours = []
         for contour in contours:
@@ -160,7 +281,8 @@ class AdvancedHandTracker:
                 if perimeter > 0:
                     circularity = 4 * np.pi * area / (perimeter * perimeter)
                     if 0.1 < circularity < 0.7:  # Not too circular, not too complex
-                        filtered_contours.append(contour)
+                        filtered_contours.append(
+                            cv2.approxPolyDP(contour, 0.003 * perimeter, True))
                         
         return filtered_contours
         
@@ -183,8 +305,11 @@ class AdvancedHandTracker:
         center_x = x + w // 2
         center_y = y + h // 2
         
-        # Get convex hull and defects for finger detection
+        # Get convex hull and defects for finger detection; hull area is
+        # computed here once and threaded through so the confidence scoring
+        # doesn't redo the O(N) hull/area work per candidate
         hull = cv2.convexHull(contour, returnPoints=False)
+        hull_area = cv2.contourArea(cv2.convexHull(contour))
         if len(hull) > 3:
             try:
                 defects = cv2.convexityDefects(contour, hull)
@@ -193,9 +318,10 @@ class AdvancedHandTracker:
                 finger_count = 0
         else:
             finger_count = 0
-            
+
         # Calculate confidence based on multiple factors
-        confidence = self._calculate_confidence(contour, detection_type, finger_count, aspect_ratio)
+        confidence = self._calculate_confidence(detection_type, finger_count,
+                                                aspect_ratio, area, hull_area)
         
         if confidence < 0.3:
             return None
@@ -228,38 +354,35 @@ class AdvancedHandTracker:
         """Count extended fingers using convexity defects"""
         if defects is None:
             return 0
-            
-        finger_count = 0
-        for i in range(defects.shape[0]):
-            s, e, f, d = defects[i, 0]
-            start = tuple(contour[s][0])
-            end = tuple(contour[e][0])
-            far = tuple(contour[f][0])
-            
-            # Calculate distances
-            a = np.sqrt((end[0] - start[0])**2 + (end[1] - start[1])**2)
-            b = np.sqrt((far[0] - start[0])**2 + (far[1] - start[1])**2)
-            c = np.sqrt((end[0] - far[0])**2 + (end[1] - far[1])**2)
-            
-            # Calculate angle using cosine rule
-            if b > 0 and c > 0:
-                angle = np.arccos((b**2 + c**2 - a**2) / (2 * b * c))
-                
-                # If angle is less than 90 degrees and defect depth is significant
-                if angle <= np.pi/2 and d > 2000:
-                    finger_count += 1
-                    
+
+        # Gather all defect triangles at once instead of indexing the
+        # contour point by point in a Python loop. reshape tolerates both
+        # the (N,1,4) and (N,4) layouts convexityDefects returns across
+        # OpenCV versions
+        defects = defects.reshape(-1, 4)
+        s, e, f, d = defects[:, 0], defects[:, 1], defects[:, 2], defects[:, 3]
+        start = contour[s, 0].astype(np.float64)
+        end = contour[e, 0].astype(np.float64)
+        far = contour[f, 0].astype(np.float64)
+
+        # Squared side lengths of each triangle (cosine rule inputs)
+        a2 = ((end - start) ** 2).sum(axis=1)
+        b2 = ((far - start) ** 2).sum(axis=1)
+        c2 = ((end - far) ** 2).sum(axis=1)
+
+        # angle <= 90 degrees is equivalent to cos(angle) >= 0, so the
+        # arccos (and the sqrt of a2) drop out entirely
+        cos_a = (b2 + c2 - a2) / (2.0 * np.sqrt(b2 * c2) + 1e-9)
+        # b2/c2 > 0 preserves the old skip of degenerate triangles
+        finger_count = int(((cos_a >= 0) & (d > 2000) & (b2 > 0) & (c2 > 0)).sum())
+
         return min(finger_count, 5)  # Maximum 5 fingers
         
     def _find_palm_center(self, contour: np.ndarray) -> Tuple[int, int]:
         """Find the center of the palm (more stable than centroid)"""
-        # Find the largest inscribed circle center
-        dist_transform = cv2.distanceTransform(
-            np.zeros((480, 640), dtype=np.uint8), 
-            cv2.DIST_L2, 5
-        )
-        
-        # For now, use centroid as approximation
+        # Centroid approximation - a previous inscribed-circle attempt left
+        # a distanceTransform over a full-frame zero mask here whose result
+        # was never used, burning a 480x640 pass per detection
         M = cv2.moments(contour)
         if M["m00"] != 0:
             center_x = int(M["m10"] / M["m00"])
@@ -269,12 +392,12 @@ class AdvancedHandTracker:
             x, y, w, h = cv2.boundingRect(contour)
             return (x + w//2, y + h//2)
             
-    def _calculate_confidence(self, contour: np.ndarray, detection_type: str, finger_count: int, aspect_ratio: float) -> float:
+    def _calculate_confidence(self, detection_type: str, finger_count: int,
+                              aspect_ratio: float, area: float, hull_area: float) -> float:
         """Calculate confidence score based on multiple factors"""
         confidence = 0.5  # Base confidence
-        
+
         # Area factor
-        area = cv2.contourArea(contour)
         if 3000 < area < 12000:  # Ideal hand size
             confidence += 0.2
         elif 1500 < area < 20000:  # Acceptable range
@@ -301,8 +424,6 @@ class AdvancedHandTracker:
             confidence += 0.05
             
         # Convexity factor
-        hull = cv2.convexHull(contour)
-        hull_area = cv2.contourArea(hull)
         if hull_area > 0:
             solidity = area / hull_area
             if 0.7 < solidity < 0.95:  # Good hand solidity
@@ -316,41 +437,34 @@ class AdvancedHandTracker:
             return None
             
         if len(candidates) == 1:
+            # Record the position even on the single-candidate early-out so
+            # continuity bonuses and the static-scene fast path see it
+            self.last_position = candidates[0]['center']
             return candidates[0]
             
-        # Score candidates based on multiple criteria
-        scored_candidates = []
-        for candidate in candidates:
-            score = candidate['confidence']
-            
-            # Prefer candidates closer to previous position
-            if self.last_position:
-                distance = np.sqrt(
-                    (candidate['center'][0] - self.last_position[0])**2 + 
-                    (candidate['center'][1] - self.last_position[1])**2
-                )
-                # Bonus for continuity (closer to last position)
-                if distance < 100:
-                    score += 0.2
-                elif distance < 200:
-                    score += 0.1
-                    
-            # Prefer candidates in upper part of frame (hands are usually raised)
-            frame_height = frame.shape[0]
-            y_position = candidate['center'][1]
-            if y_position < frame_height * 0.7:  # Upper 70% of frame
-                score += 0.1
-                
-            # Prefer moderate sizes
-            area = candidate['area']
-            if 3000 < area < 10000:
-                score += 0.1
-                
-            scored_candidates.append((score, candidate))
-            
-        # Return the highest scoring candidate
-        scored_candidates.sort(key=lambda x: x[0], reverse=True)
-        best_candidate = scored_candidates[0][1]
+        # Score all candidates in one vectorized pass instead of a Python
+        # loop with per-candidate scalar math
+        # (float64 so the bonus sums match the old scalar arithmetic
+        # exactly - near-tied scores otherwise flip on rounding noise)
+        centers = np.array([c['center'] for c in candidates], dtype=np.float64)
+        areas = np.fromiter((c['area'] for c in candidates), np.float64,
+                            count=len(candidates))
+        scores = np.fromiter((c['confidence'] for c in candidates), np.float64,
+                             count=len(candidates))
+
+        # Bonus for continuity (closer to last position)
+        if self.last_position:
+            distances = np.linalg.norm(centers - self.last_position, axis=1)
+            scores += np.where(distances < 100, 0.2,
+                               np.where(distances < 200, 0.1, 0.0))
+
+        # Prefer candidates in upper part of frame (hands are usually raised)
+        scores += np.where(centers[:, 1] < frame.shape[0] * 0.7, 0.1, 0.0)
+
+        # Prefer moderate sizes
+        scores += np.where((areas > 3000) & (areas < 10000), 0.1, 0.0)
+
+        best_candidate = candidates[int(scores.argmax())]
         
         # Update last position
         self.last_position = best_candidate['center']
@@ -16,59 +16,115 @@ class HandTracker:
     def __init__(self):
         self.last_position = None
         self.movement_threshold = 30  # pixels
-        
+        # Detection runs on a frame downscaled by this factor; the HSV
+        # convert, mask and morphology are memory-bound, so halving each
+        # dimension cuts their per-frame cost ~4x. Results are scaled back
+        # to full-frame pixels before returning
+        self.scale = 0.5
+        # Constant per-frame arrays hoisted out of detect_hands: the skin
+        # range bounds and the separable morphology kernels never change
+        self._lower_skin = np.array([0, 30, 60], dtype=np.uint8)
+        self._upper_skin = np.array([25, 255, 255], dtype=np.uint8)
+        self._kh = np.ones((1, 5), np.uint8)
+        self._kv = np.ones((5, 1), np.uint8)
+        # Fewer skin-hued pixels than the contour area filter demands
+        # (1500 full-frame px, in working-scale units) cannot yield a hand,
+        # so such frames skip the mask/morphology/contour pipeline entirely
+        self._min_skin_pixels = int(1500 * self.scale * self.scale)
+
     def detect_hands(self, frame: np.ndarray) -> Optional[Dict]:
         """Detect hand/object in frame using color detection"""
+        scale = self.scale
+        if scale != 1.0:
+            frame = cv2.resize(frame, None, fx=scale, fy=scale,
+                               interpolation=cv2.INTER_AREA)
+        inv = 1.0 / scale
+        area_scale = inv * inv
+
         # Convert to HSV for better color detection
         hsv = cv2.cvtColor(frame, cv2.COLOR_BGR2HSV)
-        
-        # Define range for skin color detection (broader range for better detection)
-        lower_skin = np.array([0, 30, 60], dtype=np.uint8)
-        upper_skin = np.array([25, 255, 255], dtype=np.uint8)
-        
-        # Create mask for skin color
-        mask = cv2.inRange(hsv, lower_skin, upper_skin)
-        
-        # Apply morphological operations to remove noise
-        kernel = np.ones((5, 5), np.uint8)
-        mask = cv2.morphologyEx(mask, cv2.MORPH_OPEN, kernel)
-        mask = cv2.morphologyEx(mask, cv2.MORPH_CLOSE, kernel)
+
+        # Cheap hue-only pre-check: most background pixels already fail on
+        # hue alone, so a frame without enough skin-hued pixels short-
+        # circuits before the full range test, morphology and contour pass
+        hue = cv2.extractChannel(hsv, 0)
+        hue_mask = cv2.inRange(hue, int(self._lower_skin[0]), int(self._upper_skin[0]))
+        if cv2.countNonZero(hue_mask) < self._min_skin_pixels:
+            return {
+                'center': None,
+                'debug': {
+                    'contour_count': 0,
+                    'all_areas': [],
+                    'hsv_sample': None
+                }
+            }
+
+        # Create mask for skin color (broader range for better detection)
+        mask = cv2.inRange(hsv, self._lower_skin, self._upper_skin)
+
+        # Apply morphological operations to remove noise. A square kernel
+        # is separable: eroding (or dilating) with 1x5 then 5x1 equals one
+        # 5x5 pass at 10 structuring-element taps per pixel instead of 25,
+        # so open and close are spelled out as their erode/dilate halves
+        kh = self._kh
+        kv = self._kv
+        # MORPH_OPEN (erode then dilate)
+        mask = cv2.erode(mask, kh)
+        mask = cv2.erode(mask, kv)
+        mask = cv2.dilate(mask, kh)
+        mask = cv2.dilate(mask, kv)
+        # MORPH_CLOSE (dilate then erode)
+        mask = cv2.dilate(mask, kh)
+        mask = cv2.dilate(mask, kv)
+        mask = cv2.erode(mask, kh)
+        mask = cv2.erode(mask, kv)
         
         # Find contours
         contours, _ = cv2.findContours(mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
         
+        # Compute every contour area once; the debug list, the winner
+        # selection and the size filter all reuse this pass
+        areas = [cv2.contourArea(c) for c in contours]
+
         # Store debug information (JSON serializable only)
         debug_info = {
             'contour_count': len(contours),
-            'all_areas': [float(cv2.contourArea(c)) for c in contours] if contours else [],
+            # Areas reported in full-frame pixels so thresholds and logs
+            # keep their meaning regardless of the working scale
+            'all_areas': [a * area_scale for a in areas],
             'hsv_sample': None
         }
-        
+
         if contours:
             # Find largest contour (assuming it's the hand)
-            largest_contour = max(contours, key=cv2.contourArea)
-            area = cv2.contourArea(largest_contour)
-            
+            best_i = int(np.argmax(areas))
+            largest_contour = contours[best_i]
+            area = areas[best_i] * area_scale
+
             # Filter out small contours (lowered threshold)
             if area > 1500:
-                # Get bounding box
+                # Get bounding box (in small-frame coordinates)
                 x, y, w, h = cv2.boundingRect(largest_contour)
-                
+
                 # Get center point
                 center_x = x + w // 2
                 center_y = y + h // 2
-                
-                # Get topmost point (for pointing gesture)
-                topmost = tuple(largest_contour[largest_contour[:, :, 1].argmin()][0])
-                
+
+                # Get topmost point (for pointing gesture); a flat (N, 2)
+                # view keeps the argmin and the pickup on the same array
+                pts = largest_contour.reshape(-1, 2)
+                top_i = pts[:, 1].argmin()
+                topmost = (int(pts[top_i, 0]), int(pts[top_i, 1]))
+
                 # Sample HSV values at center for debugging
                 if 0 <= center_y < hsv.shape[0] and 0 <= center_x < hsv.shape[1]:
                     debug_info['hsv_sample'] = [int(hsv[center_y, center_x][i]) for i in range(3)]
-                
+
+                # Scale coordinates back to full-frame pixels
                 return {
-                    'center': (int(center_x), int(center_y)),
-                    'topmost': (int(topmost[0]), int(topmost[1])),
-                    'bbox': (int(x), int(y), int(w), int(h)),
+                    'center': (int(center_x * inv), int(center_y * inv)),
+                    'topmost': (int(topmost[0] * inv), int(topmost[1] * inv)),
+                    'bbox': (int(x * inv), int(y * inv), int(w * inv), int(h * inv)),
                     'area': float(area),
                     'debug': debug_info
                 }
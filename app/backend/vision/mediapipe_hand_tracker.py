@@ -4,6 +4,67 @@ import mediapipe as mp
 from dataclasses import dataclass
 from typing import List, Optional, Dict, Tuple
 import math
+import queue
+import threading
+
+# Optional Numba fast path for the landmark geometry: centroid, palm
+# center, bounding box, topmost point and finger states are pure integer
+# arithmetic over a fixed (21, 2) array, so one compiled kernel replaces
+# the chain of NumPy reductions. The NumPy path in _analyze_hand and
+# _detect_finger_states is the fallback.
+try:
+    from numba import njit
+    import numpy as _np
+
+    @njit(cache=True, fastmath=True)
+    def _analyze_core(pts, palm_idx, tips, pips, thumb_mcp, is_right):
+        n = pts.shape[0]
+        sum_x = 0
+        sum_y = 0
+        x_min = pts[0, 0]
+        x_max = pts[0, 0]
+        y_min = pts[0, 1]
+        y_max = pts[0, 1]
+        top_i = 0
+        for i in range(n):
+            x = pts[i, 0]
+            y = pts[i, 1]
+            sum_x += x
+            sum_y += y
+            if x < x_min:
+                x_min = x
+            elif x > x_max:
+                x_max = x
+            if y < y_min:
+                y_min = y
+            elif y > y_max:
+                y_max = y
+            if y < pts[top_i, 1]:
+                top_i = i
+        palm_x = 0
+        palm_y = 0
+        for i in range(palm_idx.shape[0]):
+            palm_x += pts[palm_idx[i], 0]
+            palm_y += pts[palm_idx[i], 1]
+        states = _np.zeros(5, _np.uint8)
+        if is_right:
+            states[0] = pts[tips[0], 0] > pts[thumb_mcp, 0]
+        else:
+            states[0] = pts[tips[0], 0] < pts[thumb_mcp, 0]
+        for i in range(1, 5):
+            states[i] = pts[tips[i], 1] < pts[pips[i], 1]
+        return (int(sum_x / n), int(sum_y / n),
+                int(palm_x / palm_idx.shape[0]), int(palm_y / palm_idx.shape[0]),
+                x_min, y_min, x_max - x_min, y_max - y_min,
+                top_i, states)
+
+    # Warm up once at import so the one-time compile does not land on the
+    # first camera frame (no-op when the on-disk cache is already hot)
+    _analyze_core(_np.zeros((21, 2), _np.int32),
+                  _np.zeros(7, _np.int64), _np.zeros(5, _np.int64),
+                  _np.zeros(5, _np.int64), 0, True)
+except ImportError:
+    _analyze_core = None
 
 @dataclass
 class HandGesture:
@@ -23,7 +84,7 @@ class MediaPipeHandTracker:
             static_image_mode=False,        # Process video stream
             max_num_hands=1,                # Only track one hand for better performance
             min_detection_confidence=0.7,   # Slightly higher for stability
-            min_tracking_confidence=0.7,    # Better tracking consistency
+            min_tracking_confidence=0.5,    # Re-run palm detection only when tracking degrades
             model_complexity=0              # Faster, lighter model (reduces inference warnings)
         )
         self.mp_drawing = mp.solutions.drawing_utils
@@ -36,18 +97,110 @@ class MediaPipeHandTracker:
         
         # Hand center and palm landmarks
         self.PALM_LANDMARKS = [0, 1, 2, 5, 9, 13, 17]  # Wrist and palm base points
-        
+
+        # Index arrays for the compiled geometry kernel (see _analyze_core)
+        self._palm_idx = np.array(self.PALM_LANDMARKS, dtype=np.int64)
+        self._tips_idx = np.array(self.FINGER_TIPS, dtype=np.int64)
+        self._pips_idx = np.array(self.FINGER_PIPS, dtype=np.int64)
+
+
         self.last_position = None
         self.last_gesture = None
-        
+
+        # Debug rendering is skipped entirely when disabled; the label
+        # coordinates that never change are laid out once here, and the
+        # height-dependent bottom rows are cached per frame height
+        self.debug_enabled = True
+        self._finger_labels = [('Thumb', (10, 30)), ('Index', (10, 55)),
+                               ('Middle', (10, 80)), ('Ring', (10, 105)),
+                               ('Pinky', (10, 130))]
+        self._bottom_rows = {}
+
+        # Inference runs on its own producer thread so the capture loop is
+        # never blocked on the model. detect_hands feeds frames through a
+        # small queue - when the model falls behind, the stalest queued
+        # frame is dropped rather than backing up the pipeline - and hands
+        # back the most recent completed result
+        self._frame_queue = queue.Queue(maxsize=2)
+        self._latest_result = None
+
+        # Reused per-frame buffers for the mirror flip and the RGB convert,
+        # allocated lazily once the frame size is known - without them each
+        # frame allocates two full-frame arrays just to feed the model
+        self._flip_buf = None
+        self._rgb_buf = None
+
+        # Motion gate: consecutive frames are compared on an 80x60
+        # grayscale thumbnail and near-identical ones reuse the previous
+        # detection instead of re-running the model. Threshold is an
+        # average difference of two grey levels per thumbnail pixel,
+        # enough headroom for sensor noise on a static scene
+        self._prev_small = None
+        self._motion_threshold = 2 * 80 * 60
+        self._inference_thread = threading.Thread(
+            target=self._inference_loop, daemon=True)
+        self._inference_thread.start()
+
+    def _inference_loop(self):
+        """Consume queued frames and publish results as they complete"""
+        while True:
+            frame = self._frame_queue.get()
+            # Attribute assignment is atomic, so readers always see either
+            # the previous or the new completed result
+            self._latest_result = self._process_frame(frame)
+
     def detect_hands(self, frame: np.ndarray) -> Optional[Dict]:
+        """Queue a frame for inference and return the latest result
+
+        Returns the most recently completed detection, which may lag the
+        submitted frame by one or two frames when the model is slower than
+        the camera. Until the first inference finishes this returns None.
+        """
+        try:
+            self._frame_queue.put_nowait(frame)
+        except queue.Full:
+            # Model is behind: replace the stalest queued frame
+            try:
+                self._frame_queue.get_nowait()
+            except queue.Empty:
+                pass
+            try:
+                self._frame_queue.put_nowait(frame)
+            except queue.Full:
+                pass
+        return self._latest_result
+
+    def _process_frame(self, frame: np.ndarray) -> Optional[Dict]:
         """Detect hands using MediaPipe"""
-        # Mirror the frame horizontally for more natural interaction
-        frame = cv2.flip(frame, 1)
-        
-        # Convert BGR to RGB (MediaPipe expects RGB)
-        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-        
+        # Skip inference entirely when the scene has not moved since the
+        # last processed frame and a result exists to reuse - hovering a
+        # stationary hand is the common case this amortizes
+        small = cv2.resize(cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY), (80, 60),
+                           interpolation=cv2.INTER_AREA)
+        prev_small = self._prev_small
+        self._prev_small = small
+        if (prev_small is not None and self._latest_result is not None
+                and cv2.norm(prev_small, small, cv2.NORM_L1) < self._motion_threshold):
+            return self._latest_result
+
+        if self._flip_buf is None or self._flip_buf.shape != frame.shape:
+            self._flip_buf = np.empty(frame.shape, dtype=np.uint8)
+            self._rgb_buf = np.empty(frame.shape, dtype=np.uint8)
+
+        # Mirror the frame horizontally for more natural interaction,
+        # flipping into the reused buffer instead of a fresh allocation
+        frame = cv2.flip(frame, 1, dst=self._flip_buf)
+
+        # Convert BGR to RGB (MediaPipe expects RGB), also into a reused
+        # buffer. The writeable flag is flipped back on first: it is left
+        # False after each inference and OpenCV refuses a read-only dst
+        rgb_frame = self._rgb_buf
+        rgb_frame.flags.writeable = True
+        cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=rgb_frame)
+
+        # Mark read-only so MediaPipe skips its defensive pre-inference copy
+        rgb_frame.flags.writeable = False
+
         # Process frame
         results = self.hands.process(rgb_frame)
         
@@ -68,17 +221,18 @@ class MediaPipeHandTracker:
             hand_landmarks = results.multi_hand_landmarks[best_hand_idx]
             handedness = results.multi_handedness[best_hand_idx]
             
-            # Convert normalized coordinates to pixel coordinates
+            # Convert normalized coordinates to pixel coordinates in one
+            # vectorized pass: a flat iterator fills a (21, 2) array, then a
+            # single multiply/cast scales all landmarks at once instead of
+            # 21 per-point Python conversions
             height, width = frame.shape[:2]
-            landmarks_px = []
-            landmarks_norm = []
-            
-            for landmark in hand_landmarks.landmark:
-                x_px = int(landmark.x * width)
-                y_px = int(landmark.y * height)
-                landmarks_px.append((x_px, y_px))
-                landmarks_norm.append((landmark.x, landmark.y))
-            
+            landmarks_norm = np.fromiter(
+                (v for p in hand_landmarks.landmark for v in (p.x, p.y)),
+                dtype=np.float64, count=42
+            ).reshape(21, 2)
+            landmarks_px = (landmarks_norm * (width, height)).astype(np.int32)
+
+
             # Calculate hand properties
             hand_info = self._analyze_hand(landmarks_px, landmarks_norm, handedness, frame.shape)
             
@@ -107,49 +261,68 @@ class MediaPipeHandTracker:
         
         return None
         
-    def _analyze_hand(self, landmarks_px: List[Tuple[int, int]], 
-                     landmarks_norm: List[Tuple[float, float]], 
+    def _analyze_hand(self, landmarks_px: np.ndarray,
+                     landmarks_norm: np.ndarray,
                      handedness, frame_shape: Tuple[int, int]) -> Optional[Dict]:
-        """Analyze hand landmarks to extract useful information"""
-        
+        """Analyze hand landmarks to extract useful information
+
+        Both landmark sets arrive as (21, 2) arrays, so every aggregate
+        below is a single column reduction instead of a Python loop.
+        """
+
         if len(landmarks_px) != 21:  # MediaPipe provides 21 landmarks per hand
             return None
-            
+
         height, width = frame_shape[:2]
-        
+
+        if _analyze_core is not None:
+            # One compiled pass over the landmarks replaces the reductions
+            # and the finger-state compares below
+            is_right = handedness.classification[0].label == "Right"
+            (center_x, center_y, palm_x, palm_y,
+             x_min, y_min, bb_w, bb_h,
+             top_i, states) = _analyze_core(
+                landmarks_px, self._palm_idx, self._tips_idx,
+                self._pips_idx, self.FINGER_MIPS[0], is_right)
+            finger_states = [bool(s) for s in states]
+            return {
+                'center': (center_x, center_y),
+                'palm_center': (palm_x, palm_y),
+                'index_tip': (int(landmarks_px[8, 0]), int(landmarks_px[8, 1])),
+                'topmost': (int(landmarks_px[top_i, 0]),
+                            int(landmarks_px[top_i, 1])),
+                'bbox': (int(x_min), int(y_min), int(bb_w), int(bb_h)),
+                'area': int(bb_w) * int(bb_h),
+                'finger_states': finger_states,
+                'fingers_up': sum(finger_states)
+            }
+
         # Calculate palm center (average of palm landmarks)
-        palm_points = [landmarks_px[i] for i in self.PALM_LANDMARKS]
-        palm_center = (
-            int(np.mean([p[0] for p in palm_points])),
-            int(np.mean([p[1] for p in palm_points]))
-        )
-        
+        palm_x, palm_y = landmarks_px[self.PALM_LANDMARKS].mean(axis=0)
+        palm_center = (int(palm_x), int(palm_y))
+
         # Calculate hand center (centroid of all landmarks)
-        center = (
-            int(np.mean([p[0] for p in landmarks_px])),
-            int(np.mean([p[1] for p in landmarks_px]))
-        )
-        
+        center_x, center_y = landmarks_px.mean(axis=0)
+        center = (int(center_x), int(center_y))
+
         # Get bounding box
-        x_coords = [p[0] for p in landmarks_px]
-        y_coords = [p[1] for p in landmarks_px]
-        bbox = (min(x_coords), min(y_coords), 
-                max(x_coords) - min(x_coords), 
-                max(y_coords) - min(y_coords))
-        
+        x_min, y_min = landmarks_px.min(axis=0)
+        x_max, y_max = landmarks_px.max(axis=0)
+        bbox = (int(x_min), int(y_min), int(x_max - x_min), int(y_max - y_min))
+
         # Calculate hand area (approximate)
         area = bbox[2] * bbox[3]
-        
+
         # Detect which fingers are extended
         finger_states = self._detect_finger_states(landmarks_px, handedness)
         fingers_up = sum(finger_states)
-        
+
         # Get index finger tip for pointing
-        index_tip = landmarks_px[8]  # Index finger tip landmark
-        
+        index_tip = (int(landmarks_px[8, 0]), int(landmarks_px[8, 1]))
+
         # Find topmost point (highest y-coordinate, lowest value)
-        topmost_idx = min(range(len(landmarks_px)), key=lambda i: landmarks_px[i][1])
-        topmost = landmarks_px[topmost_idx]
+        top_i = landmarks_px[:, 1].argmin()
+        topmost = (int(landmarks_px[top_i, 0]), int(landmarks_px[top_i, 1]))
         
         return {
             'center': center,
@@ -162,32 +335,35 @@ class MediaPipeHandTracker:
             'fingers_up': fingers_up
         }
         
-    def _detect_finger_states(self, landmarks: List[Tuple[int, int]], handedness) -> List[bool]:
+    def _detect_finger_states(self, landmarks: np.ndarray, handedness) -> List[bool]:
         """Detect which fingers are extended (up)"""
-        fingers = []
         is_right_hand = handedness.classification[0].label == "Right"
-        
-        # Thumb (special case - check x-coordinate relative to hand orientation)
-        if is_right_hand:
-            # Right hand: thumb up if tip is to the right of MCP
-            fingers.append(landmarks[self.FINGER_TIPS[0]][0] > landmarks[self.FINGER_MIPS[0]][0])
-        else:
-            # Left hand: thumb up if tip is to the left of MCP
-            fingers.append(landmarks[self.FINGER_TIPS[0]][0] < landmarks[self.FINGER_MIPS[0]][0])
-        
-        # Other fingers: check if tip is above PIP joint
-        for i in range(1, 5):
-            tip_y = landmarks[self.FINGER_TIPS[i]][1]
-            pip_y = landmarks[self.FINGER_PIPS[i]][1]
-            fingers.append(tip_y < pip_y)  # Lower y value means higher on screen
-            
-        return fingers
+
+        # Thumb (special case - check x-coordinate relative to hand orientation):
+        # right hand thumb is up if the tip is to the right of the MCP,
+        # left hand if it is to the left
+        tip_x = landmarks[self.FINGER_TIPS[0], 0]
+        mcp_x = landmarks[self.FINGER_MIPS[0], 0]
+        thumb_up = tip_x > mcp_x if is_right_hand else tip_x < mcp_x
+
+        # Other fingers: tip above PIP joint, i.e. lower y value, compared
+        # for all four fingers in one vector op
+        tips_y = landmarks[self.FINGER_TIPS[1:], 1]
+        pips_y = landmarks[self.FINGER_PIPS[1:], 1]
+        return [bool(thumb_up)] + (tips_y < pips_y).tolist()
         
     def create_debug_frame(self, frame: np.ndarray, hand_data: Optional[Dict]) -> np.ndarray:
-        """Create optimized debug visualization frame"""
+        """Create optimized debug visualization frame
+
+        Draws in place on the caller's buffer (same convention as the other
+        trackers) and is a no-op while the debug panel is disabled.
+        """
+        if not self.debug_enabled:
+            return frame
+
         # Frame is already mirrored from detect_hands, so we use it as-is
-        debug_frame = frame.copy()
-        
+        debug_frame = frame
+
         if hand_data and 'landmarks' in hand_data:
             landmarks = hand_data['landmarks']
             
@@ -197,15 +373,15 @@ class MediaPipeHandTracker:
             for i in key_points:
                 if i < len(landmarks):
                     x, y = landmarks[i]
-                    cv2.circle(debug_frame, (x, y), 4, (0, 255, 0), -1)
-            
+                    cv2.circle(debug_frame, (int(x), int(y)), 4, (0, 255, 0), -1)
+
             # Draw simple hand outline instead of full skeleton
             if len(landmarks) >= 21:
                 # Connect key points with lines
                 connections = [(0, 5), (5, 9), (9, 13), (13, 17), (17, 0)]  # Palm outline
                 for start_idx, end_idx in connections:
-                    start_point = landmarks[start_idx]
-                    end_point = landmarks[end_idx]
+                    start_point = tuple(landmarks[start_idx])
+                    end_point = tuple(landmarks[end_idx])
                     cv2.line(debug_frame, start_point, end_point, (255, 255, 0), 2)
             
             # Draw additional debug info
@@ -223,35 +399,33 @@ class MediaPipeHandTracker:
             cv2.circle(debug_frame, palm_center, 6, (0, 0, 255), -1)  # Red palm
             cv2.circle(debug_frame, index_tip, 6, (255, 255, 0), -1)  # Cyan index tip
             
-            # Draw finger states
+            # Draw finger states at the precomputed label positions
             finger_states = hand_data.get('finger_states', [])
-            finger_names = ['Thumb', 'Index', 'Middle', 'Ring', 'Pinky']
-            y_offset = 30
-            
-            for i, (name, is_up) in enumerate(zip(finger_names, finger_states)):
+            for (name, pos), is_up in zip(self._finger_labels, finger_states):
                 color = (0, 255, 0) if is_up else (0, 0, 255)
                 status = "UP" if is_up else "DOWN"
-                cv2.putText(debug_frame, f'{name}: {status}', 
-                           (10, y_offset + i * 25), 
+                cv2.putText(debug_frame, f'{name}: {status}', pos,
                            cv2.FONT_HERSHEY_SIMPLEX, 0.5, color, 1)
-            
+
             # Draw hand info
             confidence = hand_data.get('confidence', 0)
             handedness = hand_data.get('handedness', 'Unknown')
             fingers_up = hand_data.get('fingers_up', 0)
-            
-            cv2.putText(debug_frame, f'Hand: {handedness} ({confidence:.2f})', 
-                       (10, debug_frame.shape[0] - 80), 
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 2)
-            cv2.putText(debug_frame, f'Fingers Up: {fingers_up}', 
-                       (10, debug_frame.shape[0] - 60), 
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 2)
-            cv2.putText(debug_frame, f'Area: {int(hand_data.get("area", 0))}px', 
-                       (10, debug_frame.shape[0] - 40), 
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 2)
-            cv2.putText(debug_frame, 'MediaPipe Hand Detection - High Accuracy', 
-                       (10, debug_frame.shape[0] - 20), 
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 255), 1)
+
+            height = debug_frame.shape[0]
+            rows = self._bottom_rows.get(height)
+            if rows is None:
+                rows = tuple((10, height - dy) for dy in (80, 60, 40, 20))
+                self._bottom_rows[height] = rows
+
+            cv2.putText(debug_frame, f'Hand: {handedness} ({confidence:.2f})',
+                       rows[0], cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 2)
+            cv2.putText(debug_frame, f'Fingers Up: {fingers_up}',
+                       rows[1], cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 2)
+            cv2.putText(debug_frame, f'Area: {int(hand_data.get("area", 0))}px',
+                       rows[2], cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 2)
+            cv2.putText(debug_frame, 'MediaPipe Hand Detection - High Accuracy',
+                       rows[3], cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 255), 1)
         
         return debug_frame
 
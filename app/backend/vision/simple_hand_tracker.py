@@ -3,7 +3,10 @@ import numpy as np
 import mediapipe as mp
 from dataclasses import dataclass
 from typing import Optional, Tuple
+from collections import deque
+from itertools import islice
 import logging
+import math
 
 logger = logging.getLogger(__name__)
 
@@ -27,7 +30,7 @@ class SimpleHandTracker:
             static_image_mode=False,
             max_num_hands=1,
             min_detection_confidence=0.7,
-            min_tracking_confidence=0.7,
+            min_tracking_confidence=0.5,  # Re-run palm detection only when tracking degrades
             model_complexity=0
         )
         
@@ -37,8 +40,10 @@ class SimpleHandTracker:
         
         # State tracking for hysteresis and stability
         self.current_state = True  # Start with open hand
-        self.state_history = []
         self.stability_frames = 4  # Require only 4 consecutive frames for faster response
+        # Bounded deque evicts the oldest entry in O(1); the old list was
+        # periodically rebuilt via slicing to stay trimmed
+        self.state_history = deque(maxlen=self.stability_frames * 2)
         
         # Hysteresis thresholds for area ratio
         # Lower ratio = more closed (fingers inside hull)
@@ -288,13 +293,18 @@ class SimpleHandTracker:
             thumb_cmc = np.array(landmarks[1])
             palm_center = np.array(landmarks[9])  # Use same reference as other fingers
             
-            # Method 1: Thumb tip should be farther from palm than MCP
-            tip_to_palm = np.linalg.norm(thumb_tip - palm_center)
-            mcp_to_palm = np.linalg.norm(thumb_mcp - palm_center)
-            
+            # Method 1: Thumb tip should be farther from palm than MCP.
+            # All threshold tests compare squared distances - for a, b >= 0,
+            # a > k*b holds iff a^2 > k^2*b^2 - so the square roots drop out
+            d = thumb_tip - palm_center
+            tip_sq = float(d @ d)
+            d = thumb_mcp - palm_center
+            mcp_sq = float(d @ d)
+
             # Method 2: Check progression from base to tip
-            cmc_to_palm = np.linalg.norm(thumb_cmc - palm_center)
-            progression_check = tip_to_palm > max(mcp_to_palm * 1.1, cmc_to_palm * 1.2)
+            d = thumb_cmc - palm_center
+            cmc_sq = float(d @ d)
+            progression_check = tip_sq > max(mcp_sq * 1.21, cmc_sq * 1.44)
             
             # Method 3: Check if thumb is not curled back toward palm
             # Vector from MCP to IP
@@ -308,9 +318,12 @@ class SimpleHandTracker:
                 angle_check = cos_angle > -0.1  # Thumb should not be curled back too much
             
             is_extended = progression_check and angle_check
-            
-            logger.debug(f"Thumb: tip_dist={tip_to_palm:.1f}, mcp_dist={mcp_to_palm:.1f}, progression={progression_check}, angle={angle_check} -> {is_extended}")
-            
+
+            # Only the reported debug distance needs the actual root
+            tip_to_palm = math.sqrt(tip_sq)
+
+            logger.debug(f"Thumb: tip_dist={tip_to_palm:.1f}, mcp_dist_sq={mcp_sq:.1f}, progression={progression_check}, angle={angle_check} -> {is_extended}")
+
             return (is_extended, tip_to_palm)
         except Exception as e:
             logger.debug(f"Thumb extension detection error: {e}")
@@ -326,18 +339,23 @@ class SimpleHandTracker:
             dip = np.array(landmarks[dip_idx])
             mcp = np.array(landmarks[mcp_idx])
             
-            # Method 1: Tip should be farther from palm center than PIP joint
-            tip_to_palm = np.linalg.norm(tip - palm_center)
-            pip_to_palm = np.linalg.norm(pip - palm_center)
-            mcp_to_palm = np.linalg.norm(mcp - palm_center)
-            
+            # Method 1: Tip should be farther from palm center than PIP joint.
+            # Squared distances throughout - a > k*b iff a^2 > k^2*b^2 for
+            # non-negative distances - so no square roots in the checks
+            d = tip - palm_center
+            tip_sq = float(d @ d)
+            d = pip - palm_center
+            pip_sq = float(d @ d)
+            d = mcp - palm_center
+            mcp_sq = float(d @ d)
+
             # Method 2: Check if finger is generally pointing away from palm
             # Extended finger should have tip farther from palm than both PIP and MCP
-            distance_check = tip_to_palm > max(pip_to_palm * 1.2, mcp_to_palm * 1.1)
-            
+            distance_check = tip_sq > max(pip_sq * 1.44, mcp_sq * 1.21)
+
             # Method 3: Check joint progression - in extended finger, distance from palm increases
             # MCP -> PIP -> TIP should be increasing distances (with some tolerance)
-            progression_check = (pip_to_palm > mcp_to_palm * 0.9) and (tip_to_palm > pip_to_palm * 1.05)
+            progression_check = (pip_sq > mcp_sq * 0.81) and (tip_sq > pip_sq * 1.1025)
             
             # Method 4: Check finger straightness using joint angles  
             # Vector from MCP to PIP
@@ -353,10 +371,13 @@ class SimpleHandTracker:
             
             # Combine all checks - need at least distance check AND progression check
             is_extended = distance_check and progression_check and angle_check
-            
-            logger.debug(f"{finger_name}: tip={tip_to_palm:.1f}, pip={pip_to_palm:.1f}, mcp={mcp_to_palm:.1f}, "
+
+            # Only the reported debug distance needs the actual root
+            tip_to_palm = math.sqrt(tip_sq)
+
+            logger.debug(f"{finger_name}: tip={tip_to_palm:.1f}, pip_sq={pip_sq:.1f}, mcp_sq={mcp_sq:.1f}, "
                         f"dist={distance_check}, prog={progression_check}, angle={angle_check} -> {is_extended}")
-            
+
             return (is_extended, tip_to_palm)
         except Exception as e:
             logger.debug(f"{finger_name} extension detection error: {e}")
@@ -365,22 +386,17 @@ class SimpleHandTracker:
     def _update_hand_state_v2(self, is_open_detected: bool, extended_fingers: int) -> bool:
         """Update hand state with improved logic and stability checking"""
         
-        # Add detected state to history
+        # Add detected state to history; the maxlen bound handles eviction
         self.state_history.append(is_open_detected)
-        
-        # Keep only recent history
-        if len(self.state_history) > self.stability_frames * 2:
-            self.state_history = self.state_history[-self.stability_frames:]
-        
+
         # For stability, require fewer consecutive frames for reliable detections
         stability_threshold = max(3, self.stability_frames // 2) if extended_fingers >= 0 else self.stability_frames
-        
+
         # Check for stable state change
         if len(self.state_history) >= stability_threshold:
-            recent_states = self.state_history[-stability_threshold:]
-            
-            # Majority vote for state change (more forgiving than requiring all frames)
-            open_votes = sum(recent_states)
+            # Majority vote for state change (more forgiving than requiring
+            # all frames); walking from the right avoids building a slice
+            open_votes = sum(islice(reversed(self.state_history), stability_threshold))
             closed_votes = stability_threshold - open_votes
             
             if open_votes > closed_votes:  # Majority says open
@@ -397,7 +413,7 @@ class SimpleHandTracker:
                              f"(fingers: {extended_fingers}, confidence: {confidence_ratio:.2f})")
                 self.current_state = desired_state
                 # Clear history after state change
-                self.state_history = []
+                self.state_history.clear()
         
         return self.current_state
     
@@ -407,10 +423,14 @@ class SimpleHandTracker:
         return self._update_hand_state_v2(area_ratio > 0.65, -1)
     
     def create_debug_frame(self, frame: np.ndarray, gesture: Optional[SimpleHandGesture]) -> np.ndarray:
-        """Create debug visualization frame with cursor"""
-        
+        """Create debug visualization frame with cursor
+
+        Draws in place: the caller hands in a preview buffer that is
+        rewritten every frame, so the full-frame copy that used to live here
+        was a pure memory-bandwidth cost.
+        """
         # Frame is already mirrored from detect_hand_state
-        debug_frame = frame.copy()
+        debug_frame = frame
         height, width = frame.shape[:2]
         
         if gesture:
@@ -68,20 +68,21 @@ class GameManager {
       this.board.updateHover(data.position);
     });
 
-    this.wsClient.on('hand_position', (data) => {
-      if (this.isVisionMode) {
-        this.inputVisualizer.drawHandPosition(data);
-        this.updateGestureDisplay(data);
+    // Coalesced per-frame message: hand position and/or preview debug info
+    this.wsClient.on('frame_update', (data) => {
+      if (data.hand && this.isVisionMode) {
+        this.inputVisualizer.drawHandPosition(data.hand);
+        this.updateGestureDisplay(data.hand);
       }
-    });
-
-    this.wsClient.on('camera_frame', (data) => {
-      this.updateCameraPreview(data.frame);
       if (data.debug_info) {
         this.updateDebugInfo(data.debug_info);
       }
     });
 
+    this.wsClient.on('camera_frame_binary', (buffer) => {
+      this.updateCameraPreview(buffer);
+    });
+
     this.wsClient.on('camera_status', (data) => {
       this.updateCameraStatus(data.active);
     });
@@ -295,23 +296,27 @@ class GameManager {
     }
   }
 
-  updateCameraPreview(frameBase64) {
+  updateCameraPreview(frameBuffer) {
     const canvas = document.getElementById('camera-preview');
     const ctx = canvas.getContext('2d');
-    
-    console.log('Received camera frame, length:', frameBase64 ? frameBase64.length : 0);
-    
+
+    // Raw JPEG bytes straight off the wire; decode via a Blob URL instead
+    // of building a base64 data URI
+    const blob = new Blob([frameBuffer], { type: 'image/jpeg' });
+    const url = URL.createObjectURL(blob);
+
     const img = new Image();
     img.onload = () => {
-      console.log('Camera frame loaded, size:', img.width, 'x', img.height);
       canvas.width = img.width;
       canvas.height = img.height;
       ctx.drawImage(img, 0, 0);
+      URL.revokeObjectURL(url);
     };
     img.onerror = (e) => {
       console.error('Error loading camera frame:', e);
+      URL.revokeObjectURL(url);
     };
-    img.src = 'data:image/jpeg;base64,' + frameBase64;
+    img.src = url;
   }
 
   setInputMode(mode) {
@@ -13,7 +13,8 @@ class WebSocketClient {
     return new Promise((resolve, reject) => {
       try {
         this.ws = new WebSocket(this.url);
-        
+        this.ws.binaryType = 'arraybuffer';
+
         this.ws.onopen = () => {
           console.log('Connected to backend WebSocket');
           this.connected = true;
@@ -23,6 +24,12 @@ class WebSocketClient {
         };
         
         this.ws.onmessage = (event) => {
+          // Binary frames carry the raw JPEG preview that follows each
+          // camera_frame envelope - no JSON/base64 decode needed
+          if (event.data instanceof ArrayBuffer) {
+            this.handleMessage({ type: 'camera_frame_binary', data: event.data });
+            return;
+          }
           try {
             const data = JSON.parse(event.data);
             this.handleMessage(data);